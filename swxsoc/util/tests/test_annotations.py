@@ -1,51 +1,88 @@
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timezone
 from swxsoc.util import util
 import requests
 
 
+@pytest.fixture(autouse=True)
+def clear_grafana_lookups(tmp_path, monkeypatch):
+    """Fixture to start every test without cached dashboard and panel lookups."""
+    monkeypatch.setattr(
+        util, "_GRAFANA_LOOKUP_FILE", str(tmp_path / "grafana_lookup.json")
+    )
+    util.clear_grafana_cache()
+    yield
+    util.clear_grafana_cache()
+
+
 @pytest.fixture
 def mock_requests():
     """Fixture to mock requests methods."""
     with (
-        patch("requests.get") as mock_get,
-        patch("requests.post") as mock_post,
-        patch("requests.delete") as mock_delete,
+        patch.object(util._grafana_session, "get") as mock_get,
+        patch.object(util._grafana_session, "post") as mock_post,
+        patch.object(util._grafana_session, "delete") as mock_delete,
     ):
+        # requests return no results unless a test sets its own response
+        mock_get.return_value.content = b"[]"
         yield mock_get, mock_post, mock_delete
 
 
+def test_grafana_retry():
+    retry = util._grafana_session.get_adapter("https://grafana").max_retries
+
+    # only idempotent requests are retried on server errors
+    assert retry.is_retry("GET", 503)
+    assert retry.is_retry("DELETE", 429)
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("GET", 404)
+
+
+def test_to_milliseconds():
+    util._to_milliseconds.cache_clear()
+    time = datetime(2024, 9, 16, 13, 30, 0, tzinfo=timezone.utc)
+
+    assert util._to_milliseconds(time) == 1726493400000
+    # repeated times are converted once
+    assert util._to_milliseconds(time) == 1726493400000
+    assert util._to_milliseconds.cache_info().hits == 1
+
+
 def test_query_annotations(mock_requests):
     mock_get, _, _ = mock_requests
 
     # Define mock response
     mock_response = MagicMock()
-    mock_response.json.return_value = [
-        {
-            "id": 43,
-            "alertId": 0,
-            "alertName": "",
-            "dashboardId": 7,
-            "dashboardUID": "fe0cbqalk99fkd",
-            "uid": "fe0cbqalk99fkd",
-            "panelId": 8,
-            "userId": 0,
-            "newState": "",
-            "prevState": "",
-            "created": 1730204275308,
-            "updated": 1730204275308,
-            "time": 1726489800000,
-            "timeEnd": 1726490100000,
-            "title": "Solar flare",
-            "text": "Observed solar flare",
-            "tags": ["meddea", "test"],
-            "login": "",
-            "email": "",
-            "avatarUrl": "",
-            "data": {},
-        }
-    ]
+    mock_response.content = json.dumps(
+        [
+            {
+                "id": 43,
+                "alertId": 0,
+                "alertName": "",
+                "dashboardId": 7,
+                "dashboardUID": "fe0cbqalk99fkd",
+                "uid": "fe0cbqalk99fkd",
+                "panelId": 8,
+                "userId": 0,
+                "newState": "",
+                "prevState": "",
+                "created": 1730204275308,
+                "updated": 1730204275308,
+                "time": 1726489800000,
+                "timeEnd": 1726490100000,
+                "title": "Solar flare",
+                "text": "Observed solar flare",
+                "tags": ["meddea", "test"],
+                "login": "",
+                "email": "",
+                "avatarUrl": "",
+                "data": {},
+            }
+        ]
+    ).encode()
     mock_response.status_code = 200
     mock_get.return_value = mock_response
 
@@ -88,6 +125,28 @@ def test_query_annotations(mock_requests):
     mock_get.assert_called()
 
 
+def test_query_annotations_filters(mock_requests):
+    mock_get, _, _ = mock_requests
+
+    start_time = datetime(2024, 9, 16, 13, 30, 0)
+    util.query_annotations(start_time=start_time)
+    params = mock_get.call_args.kwargs["params"]
+    assert "tags" not in params
+    assert "matchAny" not in params
+    assert "type" not in params
+
+    util.query_annotations(
+        start_time=start_time,
+        tags=["meddea", "test"],
+        match_any=True,
+        annotation_type="annotation",
+    )
+    params = mock_get.call_args.kwargs["params"]
+    assert params["tags"] == ["meddea", "test"]
+    assert params["matchAny"] == "true"
+    assert params["type"] == "annotation"
+
+
 def test_query_annotations_http_error(mock_requests):
     mock_get, _, _ = mock_requests
 
@@ -132,12 +191,121 @@ def test_query_annotations_connection_error(mock_requests):
     mock_get.assert_called()
 
 
+def test_query_annotations_timeout(mock_requests):
+    mock_get, _, _ = mock_requests
+
+    # Simulate a Grafana instance which does not respond in time
+    mock_get.side_effect = requests.exceptions.ReadTimeout("Read timed out")
+
+    # Call function
+    start_time = datetime(2024, 9, 16, 13, 30, 0)
+    result = util.query_annotations(
+        start_time=start_time,
+        dashboard_name="Test Dashboard",
+        panel_name="Test Panel",
+        tags=["test"],
+    )
+
+    # Assertions
+    assert result == []
+    assert all(
+        call.kwargs["timeout"] == util._GRAFANA_TIMEOUT
+        for call in mock_get.call_args_list
+    )
+
+
+def test_get_dashboard_and_panel_id_cached(mock_requests):
+    mock_get, _, _ = mock_requests
+
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(
+        [{"title": "Test Dashboard", "uid": "abc123"}]
+    ).encode()
+    mock_response.status_code = 200
+    mock_get.return_value = mock_response
+
+    # repeated lookups of the same dashboard only query Grafana once
+    for _ in range(3):
+        assert util.get_dashboard_id("Test Dashboard") == "abc123"
+    mock_get.assert_called_once()
+
+    mock_get.reset_mock()
+    mock_response.content = json.dumps(
+        {
+            "dashboard": {
+                "panels": [
+                    {"title": "Test Panel", "id": 8},
+                    {"title": "Other Panel", "id": 9},
+                    {"title": "Test Panel", "id": 10},
+                ]
+            }
+        }
+    ).encode()
+    # all panels of the dashboard are looked up with a single request
+    for _ in range(3):
+        assert util.get_panel_id("abc123", "Test Panel") == 8
+        assert util.get_panel_id("abc123", "Other Panel") == 9
+        assert util.get_panel_id("abc123", "Missing Panel") is None
+    mock_get.assert_called_once()
+
+
+def test_get_dashboard_id_error_not_cached(mock_requests):
+    mock_get, _, _ = mock_requests
+
+    mock_get.side_effect = requests.exceptions.ConnectionError("Connection Error")
+    assert util.get_dashboard_id("Test Dashboard") is None
+
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(
+        [{"title": "Test Dashboard", "uid": "abc123"}]
+    ).encode()
+    mock_get.side_effect = None
+    mock_get.return_value = mock_response
+    assert util.get_dashboard_id("Test Dashboard") == "abc123"
+
+
+def test_get_dashboard_and_panel_id_stored(mock_requests):
+    mock_get, _, _ = mock_requests
+
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(
+        [{"title": "Test Dashboard", "uid": "abc123"}]
+    ).encode()
+    mock_get.return_value = mock_response
+    assert util.get_dashboard_id("Test Dashboard") == "abc123"
+    assert util.get_dashboard_id("Missing Dashboard") is None
+
+    mock_response.content = json.dumps(
+        {"dashboard": {"panels": [{"title": "Test Panel", "id": 8}]}}
+    ).encode()
+    assert util.get_panel_id("abc123", "Test Panel") == 8
+    assert mock_get.call_count == 3
+
+    # a new run reads the found dashboard and panels from disk
+    util._grafana_lookup_cache.clear()
+    mock_get.reset_mock()
+    assert util.get_dashboard_id("Test Dashboard") == "abc123"
+    assert util.get_panel_id("abc123", "Test Panel") == 8
+    mock_get.assert_not_called()
+
+    # dashboards that were not found are looked up again
+    mock_response.content = b"[]"
+    assert util.get_dashboard_id("Missing Dashboard") is None
+    mock_get.assert_called_once()
+
+    # clearing the cache looks everything up again
+    util.clear_grafana_cache()
+    mock_get.reset_mock()
+    assert util.get_dashboard_id("Test Dashboard") is None
+    mock_get.assert_called_once()
+
+
 def test_create_annotation(mock_requests):
     _, mock_post, _ = mock_requests
 
     # Define mock response
     mock_response = MagicMock()
-    mock_response.json.return_value = {"id": 123}
+    mock_response.content = json.dumps({"id": 123}).encode()
     mock_response.status_code = 200
     mock_post.return_value = mock_response
 
@@ -158,6 +326,73 @@ def test_create_annotation(mock_requests):
     mock_post.assert_called_once()
 
 
+def test_create_annotation_overwrite(mock_requests):
+    mock_get, mock_post, mock_delete = mock_requests
+
+    # existing annotations, two of which have the same text and one is returned twice
+    mock_get_response = MagicMock()
+    mock_get_response.content = json.dumps(
+        [
+            {"id": 1, "text": "Observed solar flare"},
+            {"id": 2, "text": "Something else"},
+            {"id": 3, "text": "Observed solar flare"},
+            {"id": 3, "text": "Observed solar flare"},
+        ]
+    ).encode()
+    mock_get.return_value = mock_get_response
+
+    mock_delete_response = MagicMock()
+    mock_delete_response.status_code = 200
+    mock_delete.return_value = mock_delete_response
+
+    mock_post_response = MagicMock()
+    mock_post_response.content = json.dumps({"id": 4}).encode()
+    mock_post.return_value = mock_post_response
+
+    result = util.create_annotation(
+        start_time=datetime(2024, 9, 16, 13, 30, 0),
+        text="Observed solar flare",
+        tags=["meddea", "test"],
+        overwrite=True,
+    )
+
+    assert result == {"id": 4}
+    params = mock_get.call_args.kwargs["params"]
+    assert params["tags"] == ["meddea", "test"]
+    assert params["type"] == "annotation"
+    deleted_urls = sorted(call.args[0] for call in mock_delete.call_args_list)
+    assert len(deleted_urls) == 2
+    assert deleted_urls[0].endswith("/api/annotations/1")
+    assert deleted_urls[1].endswith("/api/annotations/3")
+    mock_post.assert_called_once()
+
+
+def test_create_annotations(mock_requests):
+    _, mock_post, _ = mock_requests
+
+    def post(url, headers, data, timeout):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"id": json.loads(data)["time"]}).encode()
+        return mock_response
+
+    mock_post.side_effect = post
+
+    start_times = [datetime(2024, 9, 16, 13, minute, 0) for minute in range(5)]
+    results = util.create_annotations(
+        [
+            {"start_time": start_time, "text": "Observed solar flare", "tags": ["test"]}
+            for start_time in start_times
+        ]
+    )
+
+    # results are in the order of the annotations
+    assert results == [
+        {"id": util._to_milliseconds(start_time)} for start_time in start_times
+    ]
+    assert mock_post.call_count == len(start_times)
+    assert util.create_annotations([]) == []
+
+
 def test_create_annotation_http_error(mock_requests):
     _, mock_post, _ = mock_requests
 
@@ -202,6 +437,26 @@ def test_create_annotation_connection_error(mock_requests):
     mock_post.assert_called_once()
 
 
+def test_create_annotation_timeout(mock_requests):
+    _, mock_post, _ = mock_requests
+
+    # Simulate a Grafana instance which does not respond in time
+    mock_post.side_effect = requests.exceptions.ReadTimeout("Read timed out")
+
+    # Call function
+    start_time = datetime(2024, 9, 16, 13, 30, 0)
+    result = util.create_annotation(
+        start_time=start_time,
+        text="Observed solar flare",
+        tags=["meddea", "test"],
+    )
+
+    # Assertions
+    assert result == {}
+    mock_post.assert_called_once()
+    assert mock_post.call_args.kwargs["timeout"] == util._GRAFANA_TIMEOUT
+
+
 def test_remove_annotation_by_id(mock_requests):
     _, _, mock_delete = mock_requests
 
@@ -246,3 +501,17 @@ def test_remove_annotation_by_id_connection_error(mock_requests):
     # Assertions
     assert result is False
     mock_delete.assert_called_once()
+
+
+def test_remove_annotation_by_id_timeout(mock_requests):
+    _, _, mock_delete = mock_requests
+
+    # Simulate a Grafana instance which does not respond in time
+    mock_delete.side_effect = requests.exceptions.ReadTimeout("Read timed out")
+
+    # Call function
+    result = util.remove_annotation_by_id(annotation_id=123)
+
+    # Assertions
+    assert result is False
+    mock_delete.assert_called_once()
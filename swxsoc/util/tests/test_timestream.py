@@ -1,6 +1,8 @@
 """Tests util.py that interact with timestream"""
 
 import os
+from datetime import timezone
+from unittest.mock import patch
 import boto3
 from moto import mock_aws
 from moto.core import DEFAULT_ACCOUNT_ID as ACCOUNT_ID
@@ -8,6 +10,8 @@ from moto.timestreamwrite.models import timestreamwrite_backends
 import pytest
 
 from astropy import units as u
+from astropy.table import MaskedColumn
+from astropy.time import Time
 from astropy.timeseries import TimeSeries
 
 
@@ -47,7 +51,26 @@ def mocked_timestream(aws_credentials):
         yield client
 
 
-def test_record_timeseries_quantity_1col(mocked_timestream):
+@pytest.fixture(scope="function")
+def written_records(mocked_timestream):
+    """
+    Collect the records written to Timestream with the common attributes of each write
+    merged into its records, as Timestream does.
+    """
+    records = []
+    timestream_client = util._get_timestream_client()
+    write_records = timestream_client.write_records
+
+    def record_write(**kwargs):
+        common_attributes = kwargs.get("CommonAttributes", {})
+        records.extend({**common_attributes, **record} for record in kwargs["Records"])
+        return write_records(**kwargs)
+
+    with patch.object(timestream_client, "write_records", side_effect=record_write):
+        yield records
+
+
+def test_record_timeseries_quantity_1col(written_records):
     timeseries_name = "test_measurements"
     ts = TimeSeries(
         time_start="2016-03-22T12:30:31",
@@ -58,18 +81,16 @@ def test_record_timeseries_quantity_1col(mocked_timestream):
     ts["temp4"] = [1.0, 4.0, 5.0, 6.0, 4.0] * u.deg_C
     util.record_timeseries(ts, instrument_name="test")
 
-    database_name = "dev-swxsoc_sdc_aws_logs"
-    table_name = "dev-swxsoc_measures_table"
-
-    backend = timestreamwrite_backends[ACCOUNT_ID]["us-east-1"]
-    records = backend.databases[database_name].tables[table_name].records
+    records = written_records
 
     # Assert that there should be 5 records, one for each timestamp
     assert len(records) == len(ts["temp4"])
 
     for i, record in enumerate(records):
         # Assert the time is correct
-        time = str(int(ts.time[i].to_datetime().timestamp() * 1000))
+        time = str(
+            int(ts.time[i].to_datetime(timezone=timezone.utc).timestamp() * 1000)
+        )
         assert record["Time"] == time
         assert record["MeasureName"] == timeseries_name
         # Check the MeasureValues
@@ -87,7 +108,7 @@ def test_record_timeseries_quantity_1col(mocked_timestream):
         assert temp4_measure["Type"] == "DOUBLE", "MeasureValueType does not match"
 
 
-def test_record_timeseries_quantity_multicol(mocked_timestream):
+def test_record_timeseries_quantity_multicol(written_records):
     timeseries_name = "test_measurements"
     ts = TimeSeries(time_start="2016-03-22T12:30:31", time_delta=3 * u.s, n_samples=5)
     ts["temp4"] = [1.0, 4.0, 5.0, 6.0, 4.0] * u.deg_C
@@ -95,18 +116,16 @@ def test_record_timeseries_quantity_multicol(mocked_timestream):
     ts["status"] = [0, 1, 1, 1, 2]
     util.record_timeseries(ts, ts_name=timeseries_name, instrument_name="test")
 
-    database_name = "dev-swxsoc_sdc_aws_logs"
-    table_name = "dev-swxsoc_measures_table"
-
-    backend = timestreamwrite_backends[ACCOUNT_ID]["us-east-1"]
-    records = backend.databases[database_name].tables[table_name].records
+    records = written_records
 
     # There should be 5 records, one for each timestamp
     assert len(records) == len(ts["temp4"])
 
     for i, record in enumerate(records):
         # Assert the time is correct
-        time = str(int(ts.time[i].to_datetime().timestamp() * 1000))
+        time = str(
+            int(ts.time[i].to_datetime(timezone=timezone.utc).timestamp() * 1000)
+        )
         assert record["Time"] == time
 
         # Check the MeasureValues
@@ -149,6 +168,70 @@ def test_record_timeseries_quantity_multicol(mocked_timestream):
         ), "status MeasureValueType does not match"
 
 
+def test_record_timeseries_column_types(written_records):
+    ts = TimeSeries(time_start="2016-03-22T12:30:31", time_delta=3 * u.s, n_samples=3)
+    ts["mode"] = ["science", "cal", "science"]
+    ts["flag"] = [True, False, True]
+    ts["count"] = MaskedColumn([1.5, 2.5, 3.5], mask=[False, True, False])
+    util.record_timeseries(ts, ts_name="test_measurements", instrument_name="test")
+
+    assert len(written_records) == len(ts)
+    for i, record in enumerate(written_records):
+        measure_values = {mv["Name"]: mv for mv in record["MeasureValues"]}
+        assert measure_values["mode"] == {
+            "Name": "mode",
+            "Value": ts["mode"][i],
+            "Type": "VARCHAR",
+        }
+        assert measure_values["flag"]["Value"] == str(ts["flag"][i])
+        assert measure_values["flag"]["Type"] == "VARCHAR"
+        assert measure_values["count"]["Value"] == str(ts["count"][i])
+
+    assert written_records[0]["MeasureValues"][2]["Type"] == "DOUBLE"
+    assert written_records[1]["MeasureValues"][2]["Value"] == "--"
+
+
+def test_record_timeseries_mixin_column(written_records):
+    ts = TimeSeries(time_start="2016-03-22T12:30:31", time_delta=3 * u.s, n_samples=3)
+    ts["temp4"] = [1.0, 4.0, 5.0] * u.deg_C
+    ts["received"] = Time(
+        ["2016-03-22T13:00:00", "2016-03-22T13:00:03", "2016-03-22T13:00:06"]
+    )
+    util.record_timeseries(ts, ts_name="test_measurements", instrument_name="test")
+
+    assert len(written_records) == len(ts)
+    for i, record in enumerate(written_records):
+        measure_values = {mv["Name"]: mv for mv in record["MeasureValues"]}
+        assert measure_values["temp4_deg_C"]["Value"] == str(ts["temp4"].value[i])
+        # columns without a dtype are converted value by value
+        assert measure_values["received"] == {
+            "Name": "received",
+            "Value": str(ts["received"][i]),
+            "Type": "VARCHAR",
+        }
+
+
+def test_record_timeseries_batches(mocked_timestream):
+    ts = TimeSeries(time_start="2016-03-22T12:30:31", time_delta=3 * u.s, n_samples=250)
+    ts["temp4"] = range(250) * u.deg_C
+    util.record_timeseries(ts, ts_name="test_measurements", instrument_name="test")
+
+    backend = timestreamwrite_backends[ACCOUNT_ID]["us-east-1"]
+    records = (
+        backend.databases["dev-swxsoc_sdc_aws_logs"]
+        .tables["dev-swxsoc_measures_table"]
+        .records
+    )
+
+    # all batches are written, in any order
+    assert len(records) == len(ts)
+    times = [
+        str(int(t.to_datetime(timezone=timezone.utc).timestamp() * 1000))
+        for t in ts.time
+    ]
+    assert sorted(record["Time"] for record in records) == sorted(times)
+
+
 def test_record_dimension_timestream(mocked_timestream):
     instrument_name = "eea"
     dimensions = [
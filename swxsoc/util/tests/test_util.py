@@ -1,11 +1,15 @@
 """Tests for util.py"""
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+from unittest.mock import patch
 import yaml
 from moto import mock_aws
 
 import boto3
+from botocore.exceptions import NoCredentialsError
 from pathlib import Path
 import parfive
 
@@ -64,6 +68,8 @@ tmp_file_path = Path("swxsoc/tests/config.yml")
     ("merit", time, "l2", "2.4.5", f"swxsoc_mrt_l2_{time_formatted}_v2.4.5.cdf"),
     ("nemisis", time, "l2", "1.3.5", f"swxsoc_nem_l2_{time_formatted}_v1.3.5.cdf"),
     ("spani", time, "l3", "2.4.5", f"swxsoc_spn_l3_{time_formatted}_v2.4.5.cdf"),
+    ("eea", "2024-05-01T12:34:56.999", "l1", "1.2.3", "swxsoc_eea_l1_20240501T123456_v1.2.3.cdf"),
+    ("eea", "2024-05-01T12:34:56.9999999", "l1", "1.2.3", "swxsoc_eea_l1_20240501T123457_v1.2.3.cdf"),
 ]
 )
 def test_science_filename_output_a(instrument, time, level, version, result):
@@ -217,6 +223,74 @@ def test_parse_science_filename_output():
     assert util.parse_science_filename(f) == input
 
 
+def test_parse_science_filenames():
+    """Test that batch parsing gives the same results as parsing each filename"""
+    filenames = [
+        util.create_science_filename("spani", time, "l3", "2.4.5", mode="2s"),
+        util.create_science_filename("eea", time, "l1", "1.2.3", descriptor="burst"),
+        "swxsoc_EEA_l0_2024094-124603_v01.bin",
+        util.create_science_filename("nemisis", time, "l2", "1.3.5", test=True),
+    ]
+    results = util.parse_science_filenames(filenames)
+
+    assert len(results) == len(filenames)
+    for filename, result in zip(filenames, results):
+        assert result == util.parse_science_filename(filename)
+
+    with pytest.raises(ValueError):
+        util.parse_science_filenames(
+            filenames + ["veeger_spn_2s_l3test_burst_20240406T120621_v2.4.5.cdf"]
+        )
+
+
+def test_parse_science_filenames_invalid_date():
+    """Test that a filename with an impossible date does not fail the whole batch"""
+    filenames = [
+        "swxsoc_eea_l1_20241340T000000_v1.0.0.cdf",
+        "swxsoc_eea_l1_20240101T000000_v1.0.0.cdf",
+    ]
+    results = util._parse_science_filenames(filenames, ignore_errors=True)
+    assert results[0] == {}
+    assert results[1] == util.parse_science_filename(filenames[1])
+
+    with pytest.raises(ValueError):
+        util.parse_science_filenames(filenames)
+
+
+def test_parse_science_filename_cached():
+    """Test that repeated parses of a filename return independent copies"""
+    f = "swxsoc_eea_2s_l1_burst_20240406T120621_v1.2.3.cdf"
+    result = util.parse_science_filename(f)
+    result["level"] = "l2"
+
+    assert util.parse_science_filename(f)["level"] == "l1"
+    assert util.parse_science_filename(os.path.join("data", f)) is not result
+
+    # filenames which cannot be parsed keep failing
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            util.parse_science_filename("swxsoc_eea_l1_20240406T120621_v1.2.3.txt")
+        with pytest.raises(ValueError):
+            util.parse_science_filename("swxsoc_xyz_l1_20240406T120621_v1.2.3.cdf")
+
+
+def test_parse_science_filename_concurrent():
+    """Test that filenames can be parsed from several threads while the cache is evicted"""
+    filenames = [
+        util.create_science_filename(
+            "eea", f"2024-04-{day:02d}T12:06:21", "l1", "1.2.3"
+        )
+        for day in range(1, 29)
+    ] * 20
+    with patch.object(util, "_PARSE_CACHE_SIZE", 4):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(util.parse_science_filename, filenames))
+
+    assert [result["time"].isot for result in results] == [
+        f"2024-04-{day:02d}T12:06:21.000" for day in range(1, 29)
+    ] * 20
+
+
 def test_parse_science_filename_errors_l1():
     """Test for errors in l1 and above files"""
     with pytest.raises(ValueError):
@@ -229,6 +303,22 @@ def test_parse_science_filename_errors_l1():
         util.parse_science_filename(f)
 
 
+# fmt: off
+@pytest.mark.parametrize("filename", [
+    "swxsoc_eea_l1_2024-04-06_v1.2.3.cdf",  # time not in a supported format
+    "swxsoc_EEA_l0_20240406_v01.bin",
+    "swxsoc_EEA_l0_x2024094-124603_v01.bin",  # extra characters around the time
+    "swxsoc_eea_2s_l1_20240406T120621Z_v1.2.3.cdf",
+    "swxsoc_eea_l1_2024001-120000_v1.0.0.cdf",  # l0 time format in a science file
+    "swxsoc_EEA_l0_20240406T120621_v01.bin",  # standard time format in a packet file
+])
+def test_parse_science_filename_errors_time(filename):
+    """Test that an unrecognized time component raises an error"""
+    with pytest.raises(ValueError):
+        util.parse_science_filename(filename)
+# fmt: on
+
+
 good_time = "2025-06-02T12:04:01"
 good_instrument = "eea"
 good_level = "l1"
@@ -254,6 +344,7 @@ good_version = "1.3.4"
         (good_instrument, "2023/13/04 12:06:21", good_level, good_version),  # not isot format
         (good_instrument, "2023/13/04 12:06:21", good_level, good_version),  # not isot format
         (good_instrument, "12345345", good_level, good_version),  # not valid input for time
+        (good_instrument, "2024-05-01T12:34:56junk", good_level, good_version),  # trailing characters
     ]
 )
 def test_science_filename_errors_l1_a(instrument, time, level, version):
@@ -481,6 +572,32 @@ def test_search_all_attr():
         assert result["time"] == Time("2024-04-06T12:06:21")
 
 
+@mock_aws
+def test_search_invalid_date():
+    conn = boto3.resource("s3", region_name="us-east-1")
+
+    bucket_name = "swxsoc-eea"
+    conn.create_bucket(Bucket=bucket_name)
+
+    s3 = boto3.client("s3")
+    keys = [
+        "l1/2024/01/swxsoc_eea_l1_20240140T000000_v1.0.0.cdf",
+        "l1/2024/01/swxsoc_eea_l1_20240101T000000_v1.0.0.cdf",
+    ]
+    for key in keys:
+        s3.put_object(Bucket=bucket_name, Key=key, Body=b"test data")
+
+    fido_client = util.SWXSOCClient()
+    query = util.AttrAnd([util.DevelopmentBucket(False), util.Instrument("eea")])
+    results = fido_client.search(query)
+
+    # the file with an impossible date is still listed, with unknown properties
+    assert len(results) == 2
+    results = {result["key"]: result for result in results}
+    assert results[keys[0]]["time"] == "unknown"
+    assert results[keys[1]]["time"] == Time("2024-01-01T00:00:00")
+
+
 @mock_aws
 def test_search_time_attr():
     conn = boto3.resource("s3", region_name="us-east-1")
@@ -635,6 +752,132 @@ def test_search_level_attr():
         results = fido_client.search(query)
 
 
+@mock_aws
+def test_search_level_time_attr():
+    """Test a search narrow enough to be filtered by S3 prefixes"""
+    conn = boto3.resource("s3", region_name="us-east-1")
+
+    buckets = ["swxsoc-eea", "swxsoc-nemisis", "swxsoc-merit", "swxsoc-spani"]
+
+    for bucket in buckets:
+        conn.create_bucket(Bucket=bucket)
+
+    s3 = boto3.client("s3")
+    s3.put_object(
+        Bucket=buckets[0],
+        Key="l0/2024/04/swxsoc_EEA_l0_2024094-124603_v01.bin",
+        Body=b"test data 1",
+    )
+    s3.put_object(
+        Bucket=buckets[0],
+        Key=f"l1/2024/04/swxsoc_eea_l1_{time_formatted}_v1.2.3.cdf",
+        Body=b"test data 2",
+    )
+    s3.put_object(
+        Bucket=buckets[1],
+        Key="l0/2024/05/swxsoc_NEM_l0_2024125-124603_v01.bin",
+        Body=b"test data 3",
+    )
+
+    fido_client = util.SWXSOCClient()
+
+    query = util.AttrAnd(
+        [util.Level("l0"), util.SearchTime("2024-04-01", "2024-04-30")]
+    )
+    results = fido_client.search(query)
+
+    assert len(results) == 1
+    assert results[0]["key"] == "l0/2024/04/swxsoc_EEA_l0_2024094-124603_v01.bin"
+
+
+def test_merge_queries():
+    queries = util.walker.create(
+        util.AttrAnd([util.SearchTime("2024-01-01", "2025-01-01")])
+        & (util.Level("l0") | util.Level("l1"))
+    )
+    assert len(queries) == 2
+
+    merged = util.SWXSOCClient._merge_queries(queries)
+    assert len(merged) == 1
+    assert merged[0]["level"] == ["l0", "l1"]
+
+    # a query without a level already matches all levels
+    merged = util.SWXSOCClient._merge_queries(
+        [{"level": "l0", "instrument": "EEA"}, {"instrument": "EEA"}]
+    )
+    assert merged == [{"instrument": "EEA"}]
+
+    # queries differing in more than one field are kept apart
+    queries = [
+        {"level": "l0", "instrument": "EEA"},
+        {"level": "l1", "instrument": "NEMISIS"},
+    ]
+    assert util.SWXSOCClient._merge_queries(queries) == queries
+
+
+@mock_aws
+def test_search_or_attr():
+    conn = boto3.resource("s3", region_name="us-east-1")
+
+    buckets = ["swxsoc-eea", "swxsoc-nemisis", "swxsoc-merit", "swxsoc-spani"]
+
+    for bucket in buckets:
+        conn.create_bucket(Bucket=bucket)
+
+    s3 = boto3.client("s3")
+    s3.put_object(
+        Bucket=buckets[0],
+        Key="l0/2024/04/swxsoc_EEA_l0_2024094-124603_v01.bin",
+        Body=b"test data 1",
+    )
+    s3.put_object(
+        Bucket=buckets[0],
+        Key=f"l1/2024/04/swxsoc_eea_l1_{time_formatted}_v1.2.3.cdf",
+        Body=b"test data 2",
+    )
+    s3.put_object(
+        Bucket=buckets[1],
+        Key="l0/2024/04/swxsoc_NEM_l0_2024094-124603_v01.bin",
+        Body=b"test data 3",
+    )
+    s3.put_object(
+        Bucket=buckets[2],
+        Key="l0/2024/04/swxsoc_MERIT_l0_2024094-124603_v01.bin",
+        Body=b"test data 4",
+    )
+
+    fido_client = util.SWXSOCClient()
+
+    query = util.Level("l0") & (util.Instrument("eea") | util.Instrument("nem"))
+    results = fido_client.search(query)
+    assert sorted(results["key"]) == [
+        "l0/2024/04/swxsoc_EEA_l0_2024094-124603_v01.bin",
+        "l0/2024/04/swxsoc_NEM_l0_2024094-124603_v01.bin",
+    ]
+
+    query = util.Instrument("eea") & (util.Level("l0") | util.Level("l1"))
+    results = fido_client.search(query)
+    assert len(results) == 2
+
+
+def test_generate_prefixes():
+    prefixes = util.SWXSOCClient.generate_prefixes(
+        ["l0", "l1"], "2024-11-15", "2025-02-01T12:00:00"
+    )
+    assert prefixes == [
+        "l0/2024/11/",
+        "l1/2024/11/",
+        "l0/2024/12/",
+        "l1/2024/12/",
+        "l0/2025/01/",
+        "l1/2025/01/",
+        "l0/2025/02/",
+        "l1/2025/02/",
+    ]
+
+    assert util.SWXSOCClient.generate_prefixes(["l1"], "2025-01-01", "2024-01-01") == []
+
+
 @mock_aws
 def test_search_development_bucket():
     conn = boto3.resource("s3", region_name="us-east-1")
@@ -731,3 +974,106 @@ def test_fetch():
     fido_client.fetch(results, path=".", downloader=downloader)
 
     assert downloader.queued_downloads == 2
+
+
+@mock_aws
+def test_generate_presigned_url_checks_credentials_once():
+    conn = boto3.resource("s3", region_name="us-east-1")
+
+    bucket_name = "swxsoc-eea"
+    conn.create_bucket(Bucket=bucket_name)
+
+    util.clear_bucket_credentials_cache()
+    s3_client = util._get_s3_client()
+    with patch.object(
+        s3_client, "list_objects_v2", wraps=s3_client.list_objects_v2
+    ) as mock_list:
+        for key in ["l1/a.cdf", "l1/b.cdf"]:
+            url = util.SWXSOCClient.generate_presigned_url(bucket_name, key)
+            assert key in url
+            assert "Signature" in url
+
+    mock_list.assert_called_once()
+
+
+@mock_aws
+def test_check_bucket_credentials():
+    conn = boto3.resource("s3", region_name="us-east-1")
+    bucket_names = ["swxsoc-eea", "swxsoc-nemisis", "swxsoc-merit"]
+    for bucket_name in bucket_names:
+        conn.create_bucket(Bucket=bucket_name)
+
+    util.clear_bucket_credentials_cache()
+    util._check_bucket_credentials(bucket_names + ["swxsoc-eea"])
+    assert {
+        bucket_name: util._get_bucket_credentials(bucket_name)
+        for bucket_name in util._bucket_credentials
+    } == {bucket_name: True for bucket_name in bucket_names}
+
+    # buckets that could not be checked are left to be checked again
+    util.clear_bucket_credentials_cache()
+    util._check_bucket_credentials(["swxsoc-eea", "missing-bucket"])
+    assert list(util._bucket_credentials) == ["swxsoc-eea"]
+
+
+@mock_aws
+def test_bucket_credentials_expire():
+    conn = boto3.resource("s3", region_name="us-east-1")
+    bucket_name = "swxsoc-eea"
+    conn.create_bucket(Bucket=bucket_name)
+
+    util.clear_bucket_credentials_cache()
+    s3_client = util._get_s3_client()
+    with patch.object(
+        s3_client,
+        "list_objects_v2",
+        side_effect=NoCredentialsError(),
+    ):
+        assert util._has_bucket_credentials(bucket_name) is False
+
+    # missing access is remembered briefly
+    assert util._has_bucket_credentials(bucket_name) is False
+
+    # the access is checked again once the result has expired
+    with patch.object(
+        util.time,
+        "monotonic",
+        return_value=util.time.monotonic() + util._NO_BUCKET_CREDENTIALS_TTL + 1,
+    ):
+        assert util._has_bucket_credentials(bucket_name) is True
+
+    # or after clearing the results
+    with patch.object(s3_client, "list_objects_v2", side_effect=NoCredentialsError()):
+        util.clear_bucket_credentials_cache()
+        assert util._has_bucket_credentials(bucket_name) is False
+    util.clear_bucket_credentials_cache()
+
+
+@mock_aws
+def test_list_files_in_s3():
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket="swxsoc-eea")
+    conn.create_bucket(Bucket="swxsoc-merit")
+
+    s3 = boto3.client("s3")
+    keys = ["l0/2024/04/a.bin", "l1/2024/04/b.cdf", "l1/2024/05/c.cdf"]
+    for key in keys:
+        s3.put_object(Bucket="swxsoc-eea", Key=key, Body=b"test data")
+    s3.put_object(Bucket="swxsoc-merit", Key="l1/2024/04/d.cdf", Body=b"test data")
+
+    buckets = ["swxsoc-eea", "swxsoc-merit"]
+    files = util.SWXSOCClient.list_files_in_s3(buckets)
+    assert sorted(f["Key"] for f in files) == sorted(keys + ["l1/2024/04/d.cdf"])
+    assert all(f["Size"] == 9 for f in files)
+
+    files = util.SWXSOCClient.list_files_in_s3(buckets, prefixes=["l1/2024/04/"])
+    assert sorted((f["Bucket"], f["Key"]) for f in files) == [
+        ("swxsoc-eea", "l1/2024/04/b.cdf"),
+        ("swxsoc-merit", "l1/2024/04/d.cdf"),
+    ]
+
+    # keys are matched against the start of the pattern
+    files = util.SWXSOCClient.list_files_in_s3(
+        buckets, key_regex=re.compile("l1/2024/05/|2024")
+    )
+    assert [f["Key"] for f in files] == ["l1/2024/05/c.cdf"]
@@ -2,36 +2,48 @@
 This module provides general utility functions.
 """
 
+import json
+import logging
 import os
-from datetime import datetime, timezone
+import re
+import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from typing import Iterable, List, Dict, Optional, Tuple, Union
 
 from astropy.time import Time
 import astropy.units as u
+import numpy as np
 from astropy.timeseries import TimeSeries
 import requests
-from datetime import datetime
-from typing import List, Dict, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import boto3
 from botocore.exceptions import NoCredentialsError, ClientError
 from botocore import UNSIGNED
 from botocore.client import Config
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from parfive import Downloader
-import sunpy.util.net
-import sunpy.time
 import sunpy.net.attrs as a
 from sunpy.net.attr import AttrWalker, AttrAnd, AttrOr, SimpleAttr
 from sunpy.net.base_client import BaseClient, QueryResponseTable, convert_row_to_table
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import swxsoc
+from swxsoc.util.config import CACHE_DIR
 
 
 __all__ = [
     "create_science_filename",
     "parse_science_filename",
+    "parse_science_filenames",
     "SWXSOCClient",
     "VALID_DATA_LEVELS",
     "SearchTime",
@@ -41,8 +53,11 @@ __all__ = [
     "record_timeseries",
     "get_dashboard_id",
     "get_panel_id",
+    "clear_grafana_cache",
+    "clear_bucket_credentials_cache",
     "query_annotations",
     "create_annotation",
+    "create_annotations",
     "remove_annotation_by_id",
     "_record_dimension_timestream",
     "VALID_DATA_LEVELS",
@@ -51,8 +66,154 @@ __all__ = [
 TIME_FORMAT_L0 = "%Y%j-%H%M%S"
 TIME_FORMAT = "%Y%m%dT%H%M%S"
 VALID_DATA_LEVELS = ["l0", "l1", "ql", "l2", "l3", "l4"]
+_VALID_DATA_LEVELS_SET = frozenset(VALID_DATA_LEVELS)
+# data levels valid for science files (i.e. not l0)
+_VALID_SCIENCE_DATA_LEVELS_SET = frozenset(VALID_DATA_LEVELS[1:])
 FILENAME_EXTENSION = ".cdf"
 
+# Time formats used in science filenames and the patterns of times in those formats, keyed by
+# format name. Standard science files use the standard format and packet files the l0 format.
+_TIME_FORMATS = {
+    "standard": TIME_FORMAT,
+    "l0": TIME_FORMAT_L0,
+}
+_TIME_RES = {
+    "standard": re.compile(r"\d{8}T\d{6}"),
+    "l0": re.compile(r"\d{7}-\d{6}"),
+}
+_VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+# ISOT times reformatted without building a Time, longer fractions of a second are left to Time
+# as it rounds those rather than truncating them
+_ISOT_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d{0,3})?")
+
+# Values derived from the mission configuration, rebuilt whenever the configuration is reloaded
+_mission_cache = {"mission": None, "values": {}}
+# maximum number of parsed filenames kept by parse_science_filename
+_PARSE_CACHE_SIZE = 16384
+_parse_cache_lock = threading.Lock()
+# whether the available credentials give access to each S3 bucket, mapped to
+# (expiry time, has credentials), see _has_bucket_credentials
+_bucket_credentials = {}
+# seconds for which the access to a bucket is reused, credentials may be added or rotated
+# at any time so missing access is only remembered briefly
+_BUCKET_CREDENTIALS_TTL = 300
+_NO_BUCKET_CREDENTIALS_TTL = 30
+# maximum number of S3 buckets listed concurrently
+_MAX_S3_WORKERS = 16
+# maximum number of record batches written to Timestream concurrently
+_MAX_TIMESTREAM_WORKERS = 8
+# maximum number of key prefixes listed from S3 separately instead of listing whole buckets
+_MAX_S3_PREFIXES = 48
+# Dashboard UIDs and panel IDs looked up from Grafana, keyed by the lookup and mapped to
+# (expiry time, value), see _get_grafana_lookup
+_grafana_lookup_cache = {}
+_grafana_lookup_lock = threading.Lock()
+# seconds for which looked up dashboard UIDs and panel IDs are reused
+_GRAFANA_LOOKUP_TTL = 300
+# file keeping found dashboard UIDs and panel IDs between runs, and seconds for which they are reused
+_GRAFANA_LOOKUP_FILE = os.path.join(CACHE_DIR, "grafana_lookup.json")
+_GRAFANA_LOOKUP_FILE_TTL = 24 * 60 * 60
+# headers for Grafana requests and the API key they were built with, see _get_grafana_headers
+_grafana_headers = {"api_key": None, "headers": None}
+# maximum number of concurrent requests to Grafana
+_MAX_GRAFANA_WORKERS = 10
+# seconds to wait for connecting to and for each response from Grafana
+_GRAFANA_TIMEOUT = (3, 10)
+# Config of the shared AWS clients, keeping enough connections open for the concurrent requests
+_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+def _get_mission_value(name: str, factory):
+    """
+    Returns a value derived from the mission configuration, computing it only once per configuration.
+
+    The cache is keyed on the identity of ``swxsoc.config["mission"]`` so that it is invalidated
+    when the configuration is reloaded (e.g. by `swxsoc._reconfigure`).
+
+    Parameters
+    ----------
+    name : `str`
+        The name under which the derived value is cached.
+    factory : callable
+        Called with the mission configuration to compute the value on a cache miss.
+
+    Returns
+    -------
+    value
+        The cached derived value.
+    """
+    mission = swxsoc.config["mission"]
+    if _mission_cache["mission"] is not mission:
+        # keep a reference to the mission configuration so its identity cannot be reused
+        _mission_cache["mission"] = mission
+        _mission_cache["values"] = {}
+    values = _mission_cache["values"]
+    if name not in values:
+        values[name] = factory(mission)
+    return values[name]
+
+
+def _get_instrument_mapping(mapping_name: str) -> dict:
+    """
+    Returns the reverse of an instrument mapping of the mission configuration.
+
+    Parameters
+    ----------
+    mapping_name : `str`
+        The name of the mapping in the mission configuration (e.g. "inst_to_shortname").
+
+    Returns
+    -------
+    mapping : `dict`
+        A dictionary to look up the instrument name from the mapped name.
+    """
+    return _get_mission_value(
+        mapping_name,
+        lambda mission: {v: k for k, v in mission[mapping_name].items()},
+    )
+
+
+def _get_science_filename_regex() -> re.Pattern:
+    """
+    Returns a compiled regex matching the standard science filename format of the mission.
+
+    The format matched is that produced by `create_science_filename`, namely
+
+    {mission}_{inst}_{mode}_{level}{test}_{descriptor}_{time}_v{version}
+
+    without the file extension, where mode, test and descriptor are optional.
+
+    Returns
+    -------
+    pattern : `re.Pattern`
+        The compiled regex, with a named group for each property of the filename.
+    """
+
+    def build(mission):
+        levels = "|".join(VALID_DATA_LEVELS)
+        # longest names first so an alternative is never cut short by a shorter prefix of it
+        shortnames = "|".join(
+            re.escape(name)
+            for name in sorted(
+                dict.fromkeys(mission["inst_shortnames"]), key=len, reverse=True
+            )
+        )
+        return re.compile(
+            rf"^{re.escape(mission['mission_name'])}_(?P<instrument>{shortnames})"
+            rf"(?:_(?!{levels})(?P<mode>[^_]+))?"
+            rf"_(?P<level>{levels})(?P<test>test)?"
+            r"(?:_(?P<descriptor>[^_]+))?"
+            r"_(?P<time>\d{8}T\d{6})_v(?P<version>[^_]+)$"
+        )
+
+    return _get_mission_value("science_filename_regex", build)
+
 
 def create_science_filename(
     instrument: str,
@@ -101,29 +262,39 @@ def create_science_filename(
     test_str = ""
 
     if isinstance(time, str):
-        time_str = Time(time, format="isot").strftime(TIME_FORMAT)
+        time_str = None
+        isot_match = _ISOT_RE.fullmatch(time)
+        if isot_match:
+            try:
+                # validate the fields directly rather than building a Time
+                datetime(*map(int, isot_match.groups()))
+            except ValueError:
+                # e.g. leap seconds, which only Time supports
+                pass
+            else:
+                time_str = "{}{}{}T{}{}{}".format(*isot_match.groups())
+        if time_str is None:
+            time_str = Time(time, format="isot").strftime(TIME_FORMAT)
     else:
         time_str = time.strftime(TIME_FORMAT)
 
-    if instrument not in swxsoc.config["mission"]["inst_names"]:
+    mission = swxsoc.config["mission"]
+    inst_names = _get_mission_value(
+        "inst_names", lambda mission: frozenset(mission["inst_names"])
+    )
+    if instrument not in inst_names:
         raise ValueError(
-            f"Instrument, {instrument}, is not recognized. Must be one of {swxsoc.config['mission']['inst_names']}."
+            f"Instrument, {instrument}, is not recognized. Must be one of {mission['inst_names']}."
         )
-    if level not in VALID_DATA_LEVELS[1:]:
+    if level not in _VALID_SCIENCE_DATA_LEVELS_SET:
         raise ValueError(
             f"Level, {level}, is not recognized. Must be one of {VALID_DATA_LEVELS[1:]}."
         )
-    # check that version is in the right format with three parts
-    if len(version.split(".")) != 3:
+    # check that version is in the right format with three integer parts
+    if not _VERSION_RE.fullmatch(version):
         raise ValueError(
-            f"Version, {version}, is not formatted correctly. Should be X.Y.Z"
+            f"Version, {version}, is not formatted correctly. Should be X.Y.Z with integers X, Y and Z"
         )
-    # check that version has integers in each part
-    for item in version.split("."):
-        try:
-            int_value = int(item)
-        except ValueError:
-            raise ValueError(f"Version, {version}, is not all integers.")
 
     if test is True:
         test_str = "test"
@@ -134,10 +305,23 @@ def create_science_filename(
             "The underscore symbol _ is not allowed in mode or descriptor."
         )
 
-    filename = f"{swxsoc.config['mission']['mission_name']}_{swxsoc.config['mission']['inst_to_shortname'][instrument]}_{mode}_{level}{test_str}_{descriptor}_{time_str}_v{version}"
-    filename = filename.replace("__", "_")  # reformat if mode or descriptor not given
+    mission_name = mission["mission_name"]
+    shortname = mission["inst_to_shortname"][instrument]
+    file_extension = mission["file_extension"]
+
+    filename_parts = (
+        mission_name,
+        shortname,
+        mode,
+        f"{level}{test_str}",
+        descriptor,
+        time_str,
+        f"v{version}",
+    )
+    # leave out mode and descriptor if not given
+    filename = "_".join(part for part in filename_parts if part)
 
-    return filename + swxsoc.config["mission"]["file_extension"]
+    return filename + file_extension
 
 
 def parse_science_filename(filepath: str) -> dict:
@@ -161,7 +345,49 @@ def parse_science_filename(filepath: str) -> dict:
     ValueError: If the data level >0 for packet files
     ValueError: If not a CDF File
     """
+    filename = os.path.basename(filepath)
+    # results only depend on the filename so repeated parses of the same file are looked up
+    parsed_filenames = _get_mission_value(
+        "parsed_filenames", lambda mission: OrderedDict()
+    )
+    with _parse_cache_lock:
+        result = parsed_filenames.get(filename)
+        if result is not None:
+            parsed_filenames.move_to_end(filename)
+    if result is not None:
+        if isinstance(result, str):
+            # the filename could not be parsed before, result is the error message
+            raise ValueError(result)
+        return result.copy()
+
+    try:
+        result = _parse_science_filename(filename)
+    except ValueError as e:
+        # S3 listings often contain files which are not science files, remember those too
+        _remember_parsed_filename(parsed_filenames, filename, str(e))
+        raise
+    _remember_parsed_filename(parsed_filenames, filename, result)
+    # return a copy so callers modifying the result do not modify the cached result
+    return result.copy()
+
+
+def _remember_parsed_filename(
+    parsed_filenames: OrderedDict, filename: str, result: Union[dict, str]
+) -> None:
+    """
+    Stores the result of parsing a filename, forgetting the least recently used filename if
+    more than `_PARSE_CACHE_SIZE` filenames are kept.
+    """
+    with _parse_cache_lock:
+        parsed_filenames[filename] = result
+        if len(parsed_filenames) > _PARSE_CACHE_SIZE:
+            parsed_filenames.popitem(last=False)
+
 
+def _parse_science_filename(filename: str) -> dict:
+    """
+    Parses a science filename into its consitutient properties, see `parse_science_filename`.
+    """
     result = {
         "instrument": None,
         "mode": None,
@@ -172,16 +398,23 @@ def parse_science_filename(filepath: str) -> dict:
         "descriptor": None,
     }
 
-    filename = os.path.basename(filepath)
-    file_name, file_ext = os.path.splitext(filename)
+    file_name, file_ext = _split_extension(filename)
+    mission = swxsoc.config["mission"]
+
+    # fail fast on unsupported files before doing any other work
+    if file_ext != ".bin" and file_ext != mission["file_extension"]:
+        raise ValueError(f"File extension {file_ext} not recognized.")
 
     filename_components = file_name.split("_")
 
-    if filename_components[0] != swxsoc.config["mission"]["mission_name"]:
+    if filename_components[0] != mission["mission_name"]:
         raise ValueError(f"File {filename} not recognized. Not a valid mission name.")
 
     if file_ext == ".bin":
-        if filename_components[1] not in swxsoc.config["mission"]["inst_targetnames"]:
+        inst_targetnames = _get_mission_value(
+            "inst_targetnames", lambda mission: frozenset(mission["inst_targetnames"])
+        )
+        if filename_components[1] not in inst_targetnames:
             raise ValueError(
                 f"File {filename} not recognized. Not a valid target name."
             )
@@ -191,49 +424,51 @@ def parse_science_filename(filepath: str) -> dict:
         if offset:
             result["mode"] = filename_components[2]
 
-        if filename_components[2 + offset] != VALID_DATA_LEVELS[0]:
+        level = filename_components[2 + offset]
+        if level != VALID_DATA_LEVELS[0]:
             raise ValueError(
-                f"Data level {filename_components[2 + offset]} is not correct for this file extension."
+                f"Data level {level} is not correct for this file extension."
             )
         else:
-            result["level"] = filename_components[2 + offset]
+            result["level"] = level
         #  reverse the dictionary to look up instrument name from the short name
-        from_shortname = {
-            v: k for k, v in swxsoc.config["mission"]["inst_to_targetname"].items()
-        }
+        from_shortname = _get_instrument_mapping("inst_to_targetname")
 
-        result["time"] = Time.strptime(filename_components[3 + offset], TIME_FORMAT_L0)
+        result["time"] = _parse_filename_time(filename_components[3 + offset], "l0")
 
-    elif file_ext == swxsoc.config["mission"]["file_extension"]:
-        if filename_components[1] not in swxsoc.config["mission"]["inst_shortnames"]:
+    else:
+        # the common case is matched in a single pass, other names fall back to the checks below
+        filename_match = _get_science_filename_regex().match(file_name)
+        if filename_match is not None:
+            result = _science_filename_match_to_result(filename_match)
+            result["time"] = Time(
+                _standard_time_to_isot(filename_match["time"]), format="isot"
+            )
+            return result
+
+        inst_shortnames = _get_mission_value(
+            "inst_shortnames", lambda mission: frozenset(mission["inst_shortnames"])
+        )
+        if filename_components[1] not in inst_shortnames:
             raise ValueError(
-                "File {filename} not recognized. Not a valid instrument name."
+                f"File {filename} not recognized. Not a valid instrument name."
             )
 
         #  reverse the dictionary to look up instrument name from the short name
-        from_shortname = {
-            v: k for k, v in swxsoc.config["mission"]["inst_to_shortname"].items()
-        }
+        from_shortname = _get_instrument_mapping("inst_to_shortname")
 
-        result["time"] = Time.strptime(filename_components[-2], TIME_FORMAT)
+        result["time"] = _parse_filename_time(filename_components[-2], "standard")
 
         # mode and descriptor are optional so need to figure out if one or both or none is included
-        if filename_components[2][0:2] not in VALID_DATA_LEVELS:
-            # if the first component is not data level then it is mode and the following is data level
+        # if the first component is not data level then it is mode and the following is data level
+        offset = 0 if filename_components[2][0:2] in _VALID_DATA_LEVELS_SET else 1
+        if offset:
             result["mode"] = filename_components[2]
-            result["level"] = filename_components[3].replace("test", "")
-            if "test" in filename_components[3]:
-                result["test"] = True
-            if len(filename_components) == 7:
-                result["descriptor"] = filename_components[4]
-        else:
-            result["level"] = filename_components[2].replace("test", "")
-            if "test" in filename_components[2]:
-                result["test"] = True
-            if len(filename_components) == 6:
-                result["descriptor"] = filename_components[3]
-    else:
-        raise ValueError(f"File extension {file_ext} not recognized.")
+        level = filename_components[2 + offset]
+        result["level"] = level.replace("test", "")
+        result["test"] = "test" in level
+        if len(filename_components) == 6 + offset:
+            result["descriptor"] = filename_components[3 + offset]
 
     result["instrument"] = from_shortname[filename_components[1]]
     result["version"] = filename_components[-1][1:]  # remove the v
@@ -241,6 +476,158 @@ def parse_science_filename(filepath: str) -> dict:
     return result
 
 
+def _split_extension(filename: str) -> Tuple[str, str]:
+    """
+    Splits a filename without directories into its name and extension (including the dot).
+    """
+    file_name, dot, file_ext = filename.rpartition(".")
+    # like os.path.splitext, leading dots do not start an extension
+    if not dot or not file_name.lstrip("."):
+        return filename, ""
+    return file_name, dot + file_ext
+
+
+def _parse_filename_time(time_str: str, time_format: str) -> Time:
+    """
+    Parses the time component of a science filename.
+
+    Parameters
+    ----------
+    time_str: `str`
+        The time component of a science filename
+    time_format: `str`
+        The name of the time format the file uses, one of the keys of ``_TIME_FORMATS``
+
+    Returns
+    -------
+    time : `~astropy.time.Time`
+        The parsed time.
+
+    Raises
+    ------
+    ValueError: If the time component does not match the given time format
+    """
+    if _TIME_RES[time_format].fullmatch(time_str) is None:
+        raise ValueError(f"Time {time_str} not recognized.")
+    if time_format == "standard":
+        # build the ISOT string directly, Time validates it without the cost of strptime
+        return Time(_standard_time_to_isot(time_str), format="isot")
+    time = Time(datetime.strptime(time_str, _TIME_FORMATS[time_format]))
+    time.format = "isot"
+    return time
+
+
+def _standard_time_to_isot(time_str: str) -> str:
+    """
+    Converts a time in the standard filename format (e.g. 20240406T120621) to ISOT.
+    """
+    return (
+        f"{time_str[0:4]}-{time_str[4:6]}-{time_str[6:8]}T"
+        f"{time_str[9:11]}:{time_str[11:13]}:{time_str[13:15]}"
+    )
+
+
+def _science_filename_match_to_result(filename_match: re.Match) -> dict:
+    """
+    Converts a match of the science filename regex into a parse result with the time left unparsed.
+    """
+    return {
+        "instrument": _get_instrument_mapping("inst_to_shortname")[
+            filename_match["instrument"]
+        ],
+        "mode": filename_match["mode"],
+        "test": filename_match["test"] is not None,
+        "time": None,
+        "level": filename_match["level"],
+        "version": filename_match["version"],
+        "descriptor": filename_match["descriptor"],
+    }
+
+
+def parse_science_filenames(filepaths: Iterable[str]) -> List[dict]:
+    """
+    Parses many science filenames into their consitutient properties at once.
+
+    This gives the same results as calling `parse_science_filename` on each filepath but
+    converts the times of all standard science filenames to a `~astropy.time.Time` in a
+    single vectorized call.
+
+    Parameters
+    ----------
+    filepaths: iterable of `str`
+        Fully specificied filepaths of the input files
+
+    Returns
+    -------
+    results : `list` of `dict`
+        A dictionary with each property for each filepath, in the same order.
+
+    Raises
+    ------
+    ValueError: If any of the files cannot be parsed, see `parse_science_filename`
+    """
+    return _parse_science_filenames(filepaths)
+
+
+def _parse_science_filenames(
+    filepaths: Iterable[str], ignore_errors: bool = False
+) -> List[dict]:
+    """
+    Parses many science filenames at once, see `parse_science_filenames`.
+
+    If ``ignore_errors`` is True the result of a file which cannot be parsed is an empty dictionary
+    instead of raising a ValueError.
+    """
+    mission = swxsoc.config["mission"]
+    filename_regex = _get_science_filename_regex()
+
+    results = []
+    # results of standard science filenames whose times are converted together
+    standard_results = []
+    standard_times = []
+    for filepath in filepaths:
+        # S3 keys always use "/", other paths fall back to parse_science_filename if not matched
+        file_name, file_ext = _split_extension(filepath.rpartition("/")[2])
+        filename_match = None
+        if file_ext == mission["file_extension"]:
+            filename_match = filename_regex.match(file_name)
+
+        if filename_match is None:
+            try:
+                results.append(parse_science_filename(filepath))
+            except ValueError:
+                if not ignore_errors:
+                    raise
+                results.append({})
+            continue
+
+        result = _science_filename_match_to_result(filename_match)
+        standard_results.append(result)
+        standard_times.append(_standard_time_to_isot(filename_match["time"]))
+        results.append(result)
+
+    if standard_results:
+        try:
+            times = Time(standard_times, format="isot")
+        except ValueError:
+            # some time is not a valid date, convert each time separately to find which
+            times = []
+            for time_str in standard_times:
+                try:
+                    times.append(Time(time_str, format="isot"))
+                except ValueError:
+                    if not ignore_errors:
+                        raise
+                    times.append(None)
+        for result, result_time in zip(standard_results, times):
+            if result_time is None:
+                result.clear()
+            else:
+                result["time"] = result_time
+
+    return results
+
+
 # ================================================================================================
 #                                  SWXSOC FIDO CLIENT
 # ================================================================================================
@@ -315,7 +702,7 @@ def create_or(wlk, tree):
     """
     results = []
     for sub in tree.attrs:
-        results.append(wlk.create(sub))
+        results.extend(wlk.create(sub))
     return results
 
 
@@ -410,6 +797,140 @@ def apply_development_bucket(wlk, attr, params):
     params.update({"use_development_bucket": attr.value})
 
 
+@lru_cache(maxsize=None)
+def _get_s3_client(signed: bool = True):
+    """
+    Returns a shared S3 client, creating it on first use.
+
+    Parameters
+    ----------
+    signed : `bool`
+        If True the client signs requests with the available credentials, otherwise it makes
+        unsigned (anonymous) requests for public access.
+
+    Returns
+    -------
+    client : `botocore.client.S3`
+        The S3 client.
+    """
+    if signed:
+        return boto3.client("s3", config=_CLIENT_CONFIG)
+    return boto3.client(
+        "s3", config=_CLIENT_CONFIG.merge(Config(signature_version=UNSIGNED))
+    )
+
+
+def _has_bucket_credentials(bucket_name: str) -> bool:
+    """
+    Checks whether the available credentials give access to an S3 bucket.
+
+    The check lists one object of the bucket so its result is reused for later objects in the
+    same bucket, for `_BUCKET_CREDENTIALS_TTL` seconds if the bucket can be accessed and for
+    `_NO_BUCKET_CREDENTIALS_TTL` seconds otherwise. See `clear_bucket_credentials_cache`.
+
+    Parameters
+    ----------
+    bucket_name : `str`
+        The name of the S3 bucket.
+
+    Returns
+    -------
+    has_credentials : `bool`
+        True if the bucket can be accessed with the available credentials, False if the
+        credentials are missing or access is denied.
+
+    Raises
+    ------
+    ClientError: If the check fails for any other reason
+    """
+    has_credentials = _get_bucket_credentials(bucket_name)
+    if has_credentials is not None:
+        return has_credentials
+
+    try:
+        # Try to list one object to check if credentials are available
+        _get_s3_client().list_objects_v2(Bucket=bucket_name, MaxKeys=1)
+        has_credentials = True
+    except NoCredentialsError:
+        swxsoc.log.warning("Credentials not available. Trying unsigned access.")
+        has_credentials = False
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "AccessDenied":
+            # other errors may be temporary so they are not remembered
+            raise
+        swxsoc.log.warning(f"Access denied to {bucket_name}. Trying unsigned access.")
+        has_credentials = False
+
+    ttl = _BUCKET_CREDENTIALS_TTL if has_credentials else _NO_BUCKET_CREDENTIALS_TTL
+    _bucket_credentials[bucket_name] = (time.monotonic() + ttl, has_credentials)
+    return has_credentials
+
+
+def _get_bucket_credentials(bucket_name: str) -> Optional[bool]:
+    """
+    Returns whether the credentials gave access to an S3 bucket when last checked.
+
+    Returns None if the bucket has not been checked or the result has expired.
+    """
+    cached = _bucket_credentials.get(bucket_name)
+    if cached is None or cached[0] < time.monotonic():
+        return None
+    return cached[1]
+
+
+def clear_bucket_credentials_cache() -> None:
+    """
+    Forgets whether the available credentials give access to each S3 bucket.
+
+    Use this after setting or changing AWS credentials so that the access is checked again.
+    """
+    _bucket_credentials.clear()
+
+
+def _check_bucket_credentials(bucket_names: Iterable[str]) -> None:
+    """
+    Checks the access to several S3 buckets concurrently, see `_has_bucket_credentials`.
+
+    Errors are not raised here, they are raised again when the access to the bucket is needed.
+
+    Parameters
+    ----------
+    bucket_names : `Iterable[str]`
+        The names of the S3 buckets.
+    """
+    bucket_names = [
+        bucket_name
+        for bucket_name in set(bucket_names)
+        if _get_bucket_credentials(bucket_name) is None
+    ]
+    if len(bucket_names) < 2:
+        return
+
+    # create the shared client before the checks as creating it is not thread safe
+    _get_s3_client()
+
+    def check(bucket_name):
+        try:
+            _has_bucket_credentials(bucket_name)
+        except ClientError:
+            pass
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(bucket_names), _MAX_S3_WORKERS)
+    ) as executor:
+        list(executor.map(check, bucket_names))
+
+
+@lru_cache(maxsize=None)
+def _get_timestream_client():
+    """
+    Returns a shared AWS Timestream write client, creating it on first use.
+    """
+    return boto3.client(
+        "timestream-write", region_name="us-east-1", config=_CLIENT_CONFIG
+    )
+
+
 class SWXSOCClient(BaseClient):
     """
     Client for interacting with SWXSOC data. This client provides search and fetch functionality for SWXSOC data and is based on the sunpy BaseClient for FIDO.
@@ -420,6 +941,9 @@ class SWXSOCClient(BaseClient):
 
     size_column = "size"
 
+    # the query attributes this client can handle, see _can_handle_query
+    _supported_attrs = frozenset({SearchTime, Level, Instrument, DevelopmentBucket})
+
     def search(self, query=None):
         """
         Searches for data based on the given query.
@@ -437,7 +961,7 @@ class SWXSOCClient(BaseClient):
         if query is None:
             query = AttrAnd([])
 
-        queries = walker.create(query)
+        queries = self._merge_queries(walker.create(query))
         swxsoc.log.info(f"Searching with {queries}")
 
         results = []
@@ -462,7 +986,57 @@ class SWXSOCClient(BaseClient):
             "storage_class",
             "last_modified",
         ]
-        return QueryResponseTable(names=names, rows=results, client=self)
+        table = QueryResponseTable(names=names, rows=results, client=self)
+        # give the whole size column its unit rather than creating a Quantity for every row
+        table["size"] = u.Quantity(table["size"], u.byte)
+        # likewise convert all modification times at once rather than one Time for every object
+        table["last_modified"] = Time(list(table["last_modified"]))
+        return table
+
+    @staticmethod
+    def _merge_queries(queries: list) -> list:
+        """
+        Merges queries which only differ in their level or instrument into a single query.
+
+        Every query lists the instrument buckets, so queries such as
+        ``SearchTime(...) & (Level("l0") | Level("l1"))`` are merged into one query for both
+        levels to only list the buckets once.
+
+        Parameters
+        ----------
+        queries : list
+            The query parameters created by the attribute walker.
+
+        Returns
+        -------
+        list
+            The merged query parameters, a level or instrument may be a list of values.
+        """
+        for field in ("level", "instrument"):
+            merged = {}
+            for query in queries:
+                others = frozenset(
+                    (name, tuple(value) if isinstance(value, list) else value)
+                    for name, value in query.items()
+                    if name != field
+                )
+                if others not in merged:
+                    merged[others] = dict(query)
+                    continue
+
+                merged_query = merged[others]
+                if field not in merged_query or field not in query:
+                    # a query without the field already matches all of its values
+                    merged_query.pop(field, None)
+                    continue
+
+                values = []
+                for value in (merged_query[field], query[field]):
+                    values.extend(value if isinstance(value, list) else [value])
+                merged_query[field] = list(dict.fromkeys(values))
+            queries = list(merged.values())
+
+        return queries
 
     @convert_row_to_table
     def fetch(self, query_results, *, path, downloader, **kwargs):
@@ -484,21 +1058,31 @@ class SWXSOCClient(BaseClient):
         if not isinstance(downloader, Downloader):
             raise ValueError("Downloader must be an instance of parfive.Downloader")
 
-        for row in query_results:
-            swxsoc.log.info(f"Fetching {row['key']}")
-            if path is None or path == ".":
-                path = os.getcwd()
+        if len(query_results) == 0:
+            return
+
+        if path is None or path == ".":
+            path = os.getcwd()
+
+        if os.path.exists(path) and not os.path.isdir(path):
+            raise ValueError(f"Path {path} is not a directory")
+
+        # each bucket is checked with a request to S3, so check all of them at the same time
+        _check_bucket_credentials(query_results["bucket"])
 
-            if os.path.exists(path) and not os.path.isdir(path):
-                raise ValueError(f"Path {path} is not a directory")
+        # read the columns once rather than looking up the key and bucket in every row
+        for row, key, bucket in zip(
+            query_results, query_results["key"], query_results["bucket"]
+        ):
+            swxsoc.log.info("Fetching %s", key)
 
             filepath = self._make_filename(path, row)
 
-            presigned_url = self.generate_presigned_url(row["bucket"], row["key"])
+            presigned_url = self.generate_presigned_url(bucket, key)
             url = (
                 presigned_url
                 if presigned_url is not None
-                else f'https://{row["bucket"]}.s3.amazonaws.com/{row["key"]}'
+                else f"https://{bucket}.s3.amazonaws.com/{key}"
             )
 
             downloader.enqueue_file(url, filename=filepath)
@@ -520,7 +1104,7 @@ class SWXSOCClient(BaseClient):
         str
             The full file path.
         """
-        return os.path.join(path, row["key"].split("/")[-1])
+        return os.path.join(path, row["key"].rpartition("/")[2])
 
     @staticmethod
     def generate_presigned_url(bucket_name, object_key, expiration=3600):
@@ -545,34 +1129,23 @@ class SWXSOCClient(BaseClient):
         """
         try:
             # Attempt to generate a presigned URL with credentials
-            s3_client = boto3.client("s3")
-
-            # Try to list one object to check if credentials are available
-            s3_client.list_objects_v2(Bucket=bucket_name, MaxKeys=1)
-
-            response = s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket_name, "Key": object_key},
-                ExpiresIn=expiration,
-            )
-            return response
-
-        except NoCredentialsError:
-            swxsoc.log.warning("Credentials not available. Trying unsigned access.")
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "AccessDenied":
-                swxsoc.log.warning(
-                    f"Access denied to {bucket_name}/{object_key}. Trying unsigned access."
+            if _has_bucket_credentials(bucket_name):
+                # signing is done locally so it does not need a request to S3
+                return _get_s3_client().generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": bucket_name, "Key": object_key},
+                    ExpiresIn=expiration,
                 )
-            else:
-                swxsoc.log.warning(f"Error generating presigned URL: {e}")
-                return None
+        except ClientError as e:
+            swxsoc.log.warning(f"Error generating presigned URL: {e}")
+            return None
 
         # If credentials are missing or access is denied, try unsigned access
         try:
             # Attempt to access the object with an unsigned request (public access)
-            swxsoc.log.info(f"Attempting unsigned access to {bucket_name}/{object_key}")
+            swxsoc.log.info(
+                "Attempting unsigned access to %s/%s", bucket_name, object_key
+            )
             url = f"https://{bucket_name}.s3.amazonaws.com/{object_key}"
             return url
         except ClientError as unsigned_error:
@@ -594,9 +1167,7 @@ class SWXSOCClient(BaseClient):
         bool
             True if the client can handle the query, otherwise False.
         """
-        query_attrs = set(type(x) for x in query)
-        supported_attrs = {SearchTime, Level, Instrument, DevelopmentBucket}
-        return supported_attrs.issuperset(query_attrs)
+        return all(type(x) in cls._supported_attrs for x in query)
 
     @classmethod
     def _make_search(cls, query):
@@ -624,7 +1195,7 @@ class SWXSOCClient(BaseClient):
 
         if levels is not None and len(levels) > 0:
             for level in levels:
-                if level not in VALID_DATA_LEVELS:
+                if level not in _VALID_DATA_LEVELS_SET:
                     raise ValueError(f"Invalid data level: {level}")
         else:
             levels = VALID_DATA_LEVELS
@@ -635,29 +1206,37 @@ class SWXSOCClient(BaseClient):
         if end_time is None:
             end_time = datetime.now().isoformat()
 
-        instrument_buckets = {
-            f"{swxsoc.config['mission']['inst_to_targetname'][inst]}": (
-                f"{'dev-' if use_development_bucket else ''}"
-                f"{swxsoc.config['mission']['mission_name']}-{inst}"
-            )
-            for inst in swxsoc.config["mission"]["inst_names"]
-        }
+        instrument_buckets = _get_mission_value(
+            f"instrument_buckets_{bool(use_development_bucket)}",
+            lambda mission: {
+                f"{mission['inst_to_targetname'][inst]}": (
+                    f"{'dev-' if use_development_bucket else ''}"
+                    f"{mission['mission_name']}-{inst}"
+                )
+                for inst in mission["inst_names"]
+            },
+        )
 
         swxsoc.log.debug(f"Mapping of instruments to S3 buckets: {instrument_buckets}")
 
-        if instrument is None or instrument not in instrument_buckets:
+        if instrument is not None and not isinstance(instrument, list):
+            instrument = [instrument]
+
+        if instrument is None or any(
+            inst not in instrument_buckets for inst in instrument
+        ):
             swxsoc.log.info(
                 f"No instrument specified or invalid instrument. Searching all instruments."
             )
             instrument_bucket_to_search = instrument_buckets.values()
         else:
             swxsoc.log.info(f"Searching for instrument: {instrument}")
-            instrument_bucket_to_search = [instrument_buckets[instrument]]
+            instrument_bucket_to_search = [
+                instrument_buckets[inst] for inst in instrument
+            ]
 
         swxsoc.log.debug(f"Searching in buckets: {instrument_bucket_to_search}")
 
-        files_in_s3 = cls.list_files_in_s3(instrument_bucket_to_search)
-
         if levels is not None or start_time is not None or end_time is not None:
             swxsoc.log.info(
                 f"Searching for files with level {levels} between {start_time} and {end_time}"
@@ -665,118 +1244,218 @@ class SWXSOCClient(BaseClient):
 
             prefixes = cls.generate_prefixes(levels, start_time, end_time)
 
-            files_in_s3 = [
-                f
-                for f in files_in_s3
-                if any(f["Key"].startswith(prefix) for prefix in prefixes)
-            ]
+            if len(prefixes) <= _MAX_S3_PREFIXES:
+                # let S3 filter by prefix so only the matching objects are listed
+                files_in_s3 = cls.list_files_in_s3(
+                    instrument_bucket_to_search, prefixes=prefixes
+                )
+            else:
+                # listing this many prefixes takes more requests than listing the buckets, so
+                # list the buckets and keep the matching keys while they are listed instead.
+                # A single alternation checks all prefixes in one match per key.
+                files_in_s3 = cls.list_files_in_s3(
+                    instrument_bucket_to_search,
+                    key_regex=re.compile("|".join(map(re.escape, prefixes))),
+                )
         else:
             swxsoc.log.info(f"Searching for all files")
+            files_in_s3 = cls.list_files_in_s3(instrument_bucket_to_search)
 
-        swxsoc.log.info(f"Found {len(files_in_s3)} files in S3")
-
-        rows = []
-        for s3_object in files_in_s3:
-            swxsoc.log.debug(f"Processing S3 object: {s3_object}")
+        # parse all keys together so the times of standard science files are converted at once
+        infos = _parse_science_filenames(
+            [s3_object["Key"] for s3_object in files_in_s3], ignore_errors=True
+        )
 
-            try:
-                info = parse_science_filename(s3_object["Key"])
-            except ValueError:
-                info = {}
+        if swxsoc.log.isEnabledFor(logging.DEBUG):
+            for s3_object in files_in_s3:
+                swxsoc.log.debug("Processing S3 object: %s", s3_object)
 
-            row = [
+        # the same few levels and versions repeat across many files so share the strings
+        intern = sys.intern
+        rows = [
+            [
                 info.get("instrument", "unknown"),
                 info.get("mode", "unknown"),
                 info.get("test", False),
                 info.get("time", "unknown"),
-                info.get("level", "unknown"),
-                info.get("version", "unknown"),
+                intern(info.get("level", "unknown")),
+                intern(info.get("version", "unknown")),
                 info.get("descriptor", "unknown"),
                 s3_object["Key"],
-                s3_object["Size"] * u.byte,
+                s3_object["Size"],
                 s3_object["Bucket"],
                 s3_object["ETag"],
                 s3_object["StorageClass"],
                 s3_object["LastModified"],
             ]
-            rows.append(row)
+            for s3_object, info in zip(files_in_s3, infos)
+        ]
+
+        swxsoc.log.info(f"Found {len(rows)} files in S3")
 
         return rows
 
     @staticmethod
-    def list_files_in_s3(bucket_names: list) -> list:
+    def list_files_in_s3(
+        bucket_names: list, prefixes: list = None, key_regex: re.Pattern = None
+    ) -> list:
         """
         Lists all files in the specified S3 buckets. If access is denied, it retries with an unsigned request.
 
+        The buckets are listed concurrently since listing is bound by the S3 requests.
+
         Parameters
         ----------
         bucket_names : list
             A list of S3 bucket names.
+        prefixes : list, optional
+            If given, only the files with keys starting with one of these prefixes are listed.
+        key_regex : re.Pattern, optional
+            If given, only the files with keys matching the start of this pattern are kept. Unlike
+            the prefixes the keys are matched after listing them from S3.
 
         Returns
         -------
         list
-            A list of dictionaries containing metadata about each S3 object.
+            A list of dictionaries containing metadata about each S3 object, with the
+            "LastModified" times as `datetime.datetime`.
         """
+        bucket_names = list(bucket_names)
+        if len(bucket_names) == 0:
+            return []
+
+        # the clients are safe to share between the threads but creating them from several
+        # threads at once is not, so they are created before listing the buckets
+        s3_client = _get_s3_client()
+        unsigned_s3_client = _get_s3_client(signed=False)
+
         content = []
-        s3 = boto3.client("s3")
-        paginator = s3.get_paginator("list_objects_v2")
+        with ThreadPoolExecutor(
+            max_workers=min(len(bucket_names), _MAX_S3_WORKERS)
+        ) as executor:
+            for bucket_content in executor.map(
+                partial(
+                    SWXSOCClient._list_one_bucket,
+                    s3_client=s3_client,
+                    unsigned_s3_client=unsigned_s3_client,
+                    prefixes=prefixes,
+                    key_regex=key_regex,
+                ),
+                bucket_names,
+            ):
+                content.extend(bucket_content)
 
-        for bucket_name in bucket_names:
-            try:
-                # Try with authenticated client
-                pages = paginator.paginate(Bucket=bucket_name)
-                for page in pages:
-                    for obj in page.get("Contents", []):
-                        metadata = {
-                            "Key": obj["Key"],
-                            "LastModified": sunpy.time.parse_time(obj["LastModified"]),
-                            "Size": obj["Size"],
-                            "ETag": obj["ETag"],
-                            "StorageClass": obj.get("StorageClass", "STANDARD"),
-                            "Bucket": bucket_name,
-                        }
-                        content.append(metadata)
-            except (ClientError, NoCredentialsError) as e:
-                swxsoc.log.warning(f"Error accessing bucket {bucket_name}: {e}")
-                if isinstance(e, NoCredentialsError):
-                    error_code = "NoCredentialsError"
-                elif isinstance(e, ClientError):
-                    error_code = e.response["Error"]["Code"]
-                # Retry?
-                if error_code == "AccessDenied" or error_code == "NoCredentialsError":
-                    swxsoc.log.warning(
-                        f"Access denied to bucket {bucket_name}. Trying unsigned request."
+        return content
+
+    @staticmethod
+    def _list_one_bucket(
+        bucket_name: str,
+        s3_client,
+        unsigned_s3_client,
+        prefixes: list = None,
+        key_regex: re.Pattern = None,
+    ) -> list:
+        """
+        Lists all files in a single S3 bucket. If access is denied, it retries with an unsigned request.
+
+        Parameters
+        ----------
+        bucket_name : str
+            The name of the S3 bucket.
+        s3_client : botocore.client.S3
+            The client used to list the bucket.
+        unsigned_s3_client : botocore.client.S3
+            The client making unsigned (anonymous) requests used if access is denied.
+        prefixes : list, optional
+            If given, only the files with keys starting with one of these prefixes are listed.
+        key_regex : re.Pattern, optional
+            If given, only the files with keys matching the start of this pattern are kept.
+
+        Returns
+        -------
+        list
+            A list of dictionaries containing metadata about each S3 object.
+        """
+        try:
+            # Try with authenticated client
+            return SWXSOCClient._list_bucket_objects(
+                s3_client, bucket_name, prefixes, key_regex
+            )
+        except (ClientError, NoCredentialsError) as e:
+            swxsoc.log.warning(f"Error accessing bucket {bucket_name}: {e}")
+            if isinstance(e, NoCredentialsError):
+                error_code = "NoCredentialsError"
+            elif isinstance(e, ClientError):
+                error_code = e.response["Error"]["Code"]
+            # Retry?
+            if error_code == "AccessDenied" or error_code == "NoCredentialsError":
+                swxsoc.log.warning(
+                    f"Access denied to bucket {bucket_name}. Trying unsigned request."
+                )
+                # Retry with an unsigned (anonymous) client
+                try:
+                    return SWXSOCClient._list_bucket_objects(
+                        unsigned_s3_client,
+                        bucket_name,
+                        prefixes,
+                        key_regex,
+                    )
+                except ClientError as retry_error:
+                    raise Exception(
+                        f"Unsigned request failed for bucket {bucket_name} (Ensure you have the correct IAM permissions, or are on the VPN)"
                     )
-                    # Retry with an unsigned (anonymous) client
-                    try:
-                        unsigned_s3 = boto3.client(
-                            "s3", config=Config(signature_version=UNSIGNED)
-                        )
-                        unsigned_paginator = unsigned_s3.get_paginator(
-                            "list_objects_v2"
-                        )
-                        pages = unsigned_paginator.paginate(Bucket=bucket_name)
-                        for page in pages:
-                            for obj in page.get("Contents", []):
-                                metadata = {
-                                    "Key": obj["Key"],
-                                    "LastModified": sunpy.time.parse_time(
-                                        obj["LastModified"]
-                                    ),
-                                    "Size": obj["Size"],
-                                    "ETag": obj["ETag"],
-                                    "StorageClass": obj.get("StorageClass", "STANDARD"),
-                                    "Bucket": bucket_name,
-                                }
-                                content.append(metadata)
-                    except ClientError as retry_error:
-                        raise Exception(
-                            f"Unsigned request failed for bucket {bucket_name} (Ensure you have the correct IAM permissions, or are on the VPN)"
-                        )
-                else:
-                    raise Exception(f"Error accessing bucket {bucket_name}: {e}")
+            else:
+                raise Exception(f"Error accessing bucket {bucket_name}: {e}")
+
+    @staticmethod
+    def _list_bucket_objects(
+        s3_client, bucket_name: str, prefixes: list = None, key_regex: re.Pattern = None
+    ) -> list:
+        """
+        Lists the metadata of all objects in an S3 bucket with the given client.
+
+        Parameters
+        ----------
+        s3_client : botocore.client.S3
+            The S3 client to make the requests with.
+        bucket_name : str
+            The name of the S3 bucket.
+        prefixes : list, optional
+            If given, only the objects with keys starting with one of these prefixes are listed.
+        key_regex : re.Pattern, optional
+            If given, only the objects with keys matching the start of this pattern are kept.
+
+        Returns
+        -------
+        list
+            A list of dictionaries containing metadata about each S3 object.
+        """
+        paginator = s3_client.get_paginator("list_objects_v2")
+        if prefixes is None:
+            pages = paginator.paginate(Bucket=bucket_name)
+        else:
+            pages = (
+                page
+                for prefix in prefixes
+                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+            )
 
+        # objects that do not match are dropped page by page, so all objects are never held at once
+        match = key_regex.match if key_regex is not None else None
+        content = []
+        for page in pages:
+            for obj in page.get("Contents", []):
+                if match is not None and not match(obj["Key"]):
+                    continue
+                metadata = {
+                    "Key": obj["Key"],
+                    "LastModified": obj["LastModified"],
+                    "Size": obj["Size"],
+                    "ETag": obj["ETag"],
+                    "StorageClass": sys.intern(obj.get("StorageClass", "STANDARD")),
+                    "Bucket": bucket_name,
+                }
+                content.append(metadata)
         return content
 
     @staticmethod
@@ -798,16 +1477,18 @@ class SWXSOCClient(BaseClient):
         list
             A list of prefixes.
         """
-        current_time = datetime.fromisoformat(start_time)
+        start_time = datetime.fromisoformat(start_time)
         end_time = datetime.fromisoformat(end_time)
-        prefixes = []
 
-        while current_time <= end_time:
-            for level in levels:
-                prefix = f"{level}/{current_time.year}/{current_time.month:02d}/"
-                prefixes.append(prefix)
-            current_time += relativedelta(months=1)
-            swxsoc.log.debug(f"Generated prefix: {prefix}")
+        # count months from year 0 so each month of the range is a single integer
+        start_month = start_time.year * 12 + start_time.month - 1
+        end_month = end_time.year * 12 + end_time.month - 1
+        prefixes = [
+            f"{level}/{month // 12}/{month % 12 + 1:02d}/"
+            for month in range(start_month, end_month + 1)
+            for level in levels
+        ]
+        swxsoc.log.debug(f"Generated {len(prefixes)} prefixes")
 
         return prefixes
 
@@ -828,7 +1509,7 @@ def record_timeseries(
     :type instrument_name: str
     :return: None
     """
-    timestream_client = boto3.client("timestream-write", region_name="us-east-1")
+    timestream_client = _get_timestream_client()
 
     # Get mission name from environment or default to 'hermes'
     mission_name = swxsoc.config["mission"]["mission_name"]
@@ -856,62 +1537,148 @@ def record_timeseries(
     if instrument_name != "":
         dimensions.append({"Name": "instrument", "Value": instrument_name})
 
-    records = []
-    for i, time_point in enumerate(ts.time):
-        measure_record = {
-            "Time": str(int(time_point.to_datetime().timestamp() * 1000)),
-            "Dimensions": dimensions,
-            "MeasureName": ts_name,
-            "MeasureValueType": "MULTI",
-            "MeasureValues": [],
-        }
+    # extract each column once instead of indexing the columns for every row
+    columns = []
+    for this_col in ts.colnames:
+        if this_col == "time":
+            continue
 
-        for this_col in ts.colnames:
-            if this_col == "time":
-                continue
+        # Handle both Quantity and regular values
+        if isinstance(ts[this_col], u.Quantity):
+            measure_unit = ts[this_col].unit
+            values = ts[this_col].value
+        else:
+            measure_unit = ""
+            values = ts[this_col]
+
+        # mixin columns like Time have no dtype and are converted value by value
+        dtype = getattr(values, "dtype", None)
+        if (
+            dtype is not None
+            and dtype.kind in "biufU"
+            and not isinstance(values, np.ma.MaskedArray)
+        ):
+            # numbers and text are converted to strings in one call for the whole column, all
+            # values then have the same type so the column type applies to every value
+            values = np.asarray(values)
+            strings = values.astype(str).tolist()
+            measure_type = (
+                "DOUBLE" if issubclass(values.dtype.type, (int, float)) else "VARCHAR"
+            )
+            types = [measure_type] * len(values)
+        else:
+            strings = [str(value) for value in values]
+            types = [
+                "DOUBLE" if isinstance(value, (int, float)) else "VARCHAR"
+                for value in values
+            ]
 
-            # Handle both Quantity and regular values
-            if isinstance(ts[this_col], u.Quantity):
-                measure_unit = ts[this_col].unit
-                value = ts[this_col].value[i]
-            else:
-                measure_unit = ""
-                value = ts[this_col][i]
-
-            measure_record["MeasureValues"].append(
-                {
-                    "Name": f"{this_col}_{measure_unit}" if measure_unit else this_col,
-                    "Value": str(value),
-                    "Type": "DOUBLE" if isinstance(value, (int, float)) else "VARCHAR",
-                }
+        columns.append(
+            (
+                f"{this_col}_{measure_unit}" if measure_unit else this_col,
+                strings,
+                types,
             )
+        )
 
-        records.append(measure_record)
+    # attributes shared by all records are sent once per batch instead of with every record
+    common_attributes = {
+        "Dimensions": dimensions,
+        "MeasureName": ts_name,
+        "MeasureValueType": "MULTI",
+    }
+
+    # convert all times to milliseconds since epoch at once rather than through a datetime each
+    times = ts.time.datetime64.astype("datetime64[ms]").astype(np.int64).tolist()
+    records = [
+        {
+            "Time": str(time_ms),
+            "MeasureValues": [
+                {"Name": name, "Value": values[i], "Type": types[i]}
+                for name, values, types in columns
+            ],
+        }
+        for i, time_ms in enumerate(times)
+    ]
 
     # Process records in batches of 100 to avoid exceeding the Timestream API limit
     batch_size = 100
-    for start in range(0, len(records), batch_size):
-        chunk = records[start : start + batch_size]  # noqa: E203
-        try:
-            result = timestream_client.write_records(
-                DatabaseName=database_name,
-                TableName=table_name,
-                Records=chunk,
-            )
-            swxsoc.log.info(
-                f"Successfully wrote {len(chunk)} {ts_name} records to Timestream: {database_name}/{table_name}, "
-                f"writeRecords Status: {result['ResponseMetadata']['HTTPStatusCode']}"
+    chunks = [
+        records[start : start + batch_size]  # noqa: E203
+        for start in range(0, len(records), batch_size)
+    ]
+    if len(chunks) == 0:
+        return
+
+    # the writes are bound by the Timestream requests so the batches are written concurrently
+    with ThreadPoolExecutor(
+        max_workers=min(len(chunks), _MAX_TIMESTREAM_WORKERS)
+    ) as executor:
+        for chunk in chunks:
+            executor.submit(
+                _write_timestream_records,
+                timestream_client,
+                database_name,
+                table_name,
+                chunk,
+                ts_name,
+                common_attributes,
             )
-        except timestream_client.exceptions.RejectedRecordsException as err:
-            swxsoc.log.error(f"Failed to write records to Timestream: {err}")
-            for rr in err.response["RejectedRecords"]:
-                swxsoc.log.info(f"Rejected Index {rr['RecordIndex']}: {rr['Reason']}")
-                if "ExistingVersion" in rr:
-                    swxsoc.log.info(
-                        f"Rejected record existing version: {rr['ExistingVersion']}"
-                    )
-        except Exception as err:
-            swxsoc.log.error(f"Failed to write to Timestream: {err}")
+
+
+def _write_timestream_records(
+    timestream_client,
+    database_name: str,
+    table_name: str,
+    records: list,
+    name: str,
+    common_attributes: dict = None,
+) -> None:
+    """
+    Writes a single batch of records to AWS Timestream, logging any failures.
+
+    :param timestream_client: The Timestream write client.
+    :param database_name: The name of the Timestream database.
+    :type database_name: str
+    :param table_name: The name of the Timestream table.
+    :type table_name: str
+    :param records: The records to write, at most 100.
+    :type records: list[dict]
+    :param name: The name of the recorded measurements, used in log messages.
+    :type name: str
+    :param common_attributes: Optional. Attributes shared by all records in the batch.
+    :type common_attributes: dict, optional
+    :return: None
+    """
+    kwargs = {}
+    if common_attributes:
+        kwargs["CommonAttributes"] = common_attributes
+
+    try:
+        result = timestream_client.write_records(
+            DatabaseName=database_name,
+            TableName=table_name,
+            Records=records,
+            **kwargs,
+        )
+        swxsoc.log.info(
+            "Successfully wrote %d %s records to Timestream: %s/%s, writeRecords Status: %s",
+            len(records),
+            name,
+            database_name,
+            table_name,
+            result["ResponseMetadata"]["HTTPStatusCode"],
+        )
+    except timestream_client.exceptions.RejectedRecordsException as err:
+        swxsoc.log.error(f"Failed to write records to Timestream: {err}")
+        for rr in err.response["RejectedRecords"]:
+            swxsoc.log.info("Rejected Index %s: %s", rr["RecordIndex"], rr["Reason"])
+            if "ExistingVersion" in rr:
+                swxsoc.log.info(
+                    "Rejected record existing version: %s", rr["ExistingVersion"]
+                )
+    except Exception as err:
+        swxsoc.log.error(f"Failed to write to Timestream: {err}")
 
 
 def _record_dimension_timestream(
@@ -942,7 +1709,7 @@ def _record_dimension_timestream(
     :type timestamp: str, optional
     :return: None
     """
-    timestream_client = boto3.client("timestream-write", region_name="us-east-1")
+    timestream_client = _get_timestream_client()
 
     # Use current time in milliseconds if no timestamp is provided
     if not timestamp:
@@ -1001,10 +1768,14 @@ def _record_dimension_timestream(
         swxsoc.log.error(f"Failed to write to Timestream: {e}")
 
 
+@lru_cache(maxsize=1024)
 def _to_milliseconds(dt: datetime) -> int:
     """
     Converts a datetime object to milliseconds since epoch.
 
+    Conversions are cached since the same times are usually converted for a query and the
+    annotations created from it.
+
     Args:
         dt (datetime): Datetime object to convert.
 
@@ -1019,6 +1790,198 @@ def _to_milliseconds(dt: datetime) -> int:
     return int(dt.timestamp() * 1000)
 
 
+def _get_grafana_retry() -> Retry:
+    """
+    Returns the retry policy for Grafana requests.
+
+    Connection failures are retried for all requests, since the request was never sent. Other
+    failures and responses asking to try again later (429, 502, 503, 504) are only retried for
+    idempotent requests, so an annotation is never created twice. Retries back off exponentially
+    with random jitter, following any Retry-After header sent by Grafana.
+
+    Returns:
+        Retry: The retry policy.
+    """
+    kwargs = {
+        "total": 3,
+        "backoff_factor": 1.0,
+        "status_forcelist": (429, 502, 503, 504),
+        "respect_retry_after_header": True,
+        # return the last response so that errors are still raised by raise_for_status
+        "raise_on_status": False,
+    }
+    try:
+        return Retry(backoff_max=30, backoff_jitter=0.5, **kwargs)
+    except TypeError:
+        # urllib3 < 2 does not support jitter
+        return Retry(**kwargs)
+
+
+# Session shared by all Grafana requests so connections are kept alive and reused between calls
+_grafana_session = requests.Session()
+_grafana_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=_get_grafana_retry()),
+)
+
+
+def _dump_grafana_json(data) -> bytes:
+    """
+    Serializes the body of a Grafana request to JSON, using orjson if it is installed.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        bytes: The JSON encoded data.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _load_grafana_json(response: requests.Response):
+    """
+    Parses the JSON body of a Grafana response, using orjson if it is installed.
+
+    Args:
+        response (requests.Response): The response to parse.
+
+    Returns:
+        The parsed JSON data.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def _get_grafana_url(mission_dashboard: Optional[str] = None) -> str:
+    """
+    Returns the base URL of the Grafana server of a mission.
+
+    Args:
+        mission_dashboard (Optional[str]): Name of the mission whose Grafana to use; defaults to the configured mission.
+
+    Returns:
+        str: The base URL of the Grafana server.
+    """
+    if not mission_dashboard:
+        mission_dashboard = swxsoc.config["mission"]["mission_name"]
+    return f"https://grafana.{mission_dashboard}.swsoc.smce.nasa.gov"
+
+
+def _get_grafana_headers() -> Dict[str, str]:
+    """
+    Returns the headers for Grafana requests, built once for each API key.
+
+    You need to set the GRAFANA_API_KEY environment variable to use the Grafana functions. It is
+    read on every call so that a new key is picked up.
+
+    Returns:
+        Dict[str, str]: The request headers, these must not be modified.
+    """
+    api_key = os.environ.get("GRAFANA_API_KEY", None)
+    if _grafana_headers["api_key"] != api_key or _grafana_headers["headers"] is None:
+        _grafana_headers["headers"] = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        _grafana_headers["api_key"] = api_key
+    return _grafana_headers["headers"]
+
+
+def _read_grafana_lookup_file() -> dict:
+    """
+    Reads the dashboard UIDs and panel IDs stored on disk by earlier runs.
+
+    Returns:
+        dict: The stored lookups, mapping the JSON encoded key to (expiry time, value). Empty if
+        the file does not exist or cannot be read.
+    """
+    try:
+        with open(_GRAFANA_LOOKUP_FILE, "rb") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_grafana_lookup(key: tuple) -> tuple:
+    """
+    Returns a dashboard UID or panel ID previously looked up from Grafana if it has not expired.
+
+    Lookups not made by this process are read from the file kept by earlier runs.
+
+    Args:
+        key (tuple): The key identifying the lookup.
+
+    Returns:
+        tuple: Whether an unexpired value was found, and the value (which may be None).
+    """
+    with _grafana_lookup_lock:
+        cached = _grafana_lookup_cache.get(key)
+        if cached is not None:
+            expiry, value = cached
+            if expiry >= time.monotonic():
+                return True, value
+            del _grafana_lookup_cache[key]
+
+        stored = _read_grafana_lookup_file().get(json.dumps(key))
+        if stored is None or stored[0] < time.time():
+            return False, None
+        value = stored[1]
+        _grafana_lookup_cache[key] = (time.monotonic() + _GRAFANA_LOOKUP_TTL, value)
+        return True, value
+
+
+def _set_grafana_lookup(key: tuple, value: Optional[Union[str, int]]) -> None:
+    """
+    Stores a dashboard UID or panel ID looked up from Grafana for `_GRAFANA_LOOKUP_TTL` seconds.
+
+    Found values are also written to disk for `_GRAFANA_LOOKUP_FILE_TTL` seconds so that later
+    runs do not need to look them up again.
+
+    Args:
+        key (tuple): The key identifying the lookup.
+        value (Optional[Union[str, int]]): The looked up value, None if nothing was found.
+    """
+    with _grafana_lookup_lock:
+        _grafana_lookup_cache[key] = (time.monotonic() + _GRAFANA_LOOKUP_TTL, value)
+        # something not found may be created at any time, so it is only remembered briefly
+        if not value:
+            return
+
+        now = time.time()
+        stored = {
+            stored_key: stored_value
+            for stored_key, stored_value in _read_grafana_lookup_file().items()
+            if stored_value[0] >= now
+        }
+        stored[json.dumps(key)] = (now + _GRAFANA_LOOKUP_FILE_TTL, value)
+        try:
+            os.makedirs(os.path.dirname(_GRAFANA_LOOKUP_FILE), exist_ok=True)
+            # write to a temporary file first so other processes never read a partial file
+            temp_file = f"{_GRAFANA_LOOKUP_FILE}.{os.getpid()}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump(stored, f)
+            os.replace(temp_file, _GRAFANA_LOOKUP_FILE)
+        except OSError as e:
+            swxsoc.log.debug(f"Could not store Grafana lookups: {e}")
+
+
+def clear_grafana_cache() -> None:
+    """
+    Forgets all dashboard UIDs and panel IDs looked up from Grafana, in memory and on disk.
+
+    Use this after renaming or recreating dashboards and panels so that they are looked up again.
+    """
+    with _grafana_lookup_lock:
+        _grafana_lookup_cache.clear()
+        try:
+            os.remove(_GRAFANA_LOOKUP_FILE)
+        except FileNotFoundError:
+            pass
+
+
 def get_dashboard_id(
     dashboard_name: str, mission_dashboard: Optional[str] = None
 ) -> Optional[int]:
@@ -1031,30 +1994,36 @@ def get_dashboard_id(
     Returns:
         Optional[int]: The UID of the dashboard, or None if not found.
     """
+    # the same dashboard is usually looked up for every annotation so reuse recent lookups
+    cache_key = (
+        "dashboard",
+        _get_grafana_url(mission_dashboard),
+        dashboard_name,
+    )
+    found, dashboard_uid = _get_grafana_lookup(cache_key)
+    if found:
+        return dashboard_uid
+
     try:
-        # Set the base URL and API key for Grafana Annotations API
-        # You need to set the GRAFANA_API_KEY environment variables to use this feature
-        API_KEY = os.environ.get("GRAFANA_API_KEY", None)
-        HEADERS = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-        BASE_URL = (
-            f"https://grafana.{swxsoc.config['mission']['mission_name']}.swsoc.smce.nasa.gov"
-            if not mission_dashboard
-            else f"https://grafana.{mission_dashboard}.swsoc.smce.nasa.gov"
-        )
-        response = requests.get(
-            f"{BASE_URL}/api/search", headers=HEADERS, params={"query": dashboard_name}
+        HEADERS = _get_grafana_headers()
+        BASE_URL = _get_grafana_url(mission_dashboard)
+        response = _grafana_session.get(
+            f"{BASE_URL}/api/search",
+            headers=HEADERS,
+            params={"query": dashboard_name},
+            timeout=_GRAFANA_TIMEOUT,
         )
         response.raise_for_status()
-        dashboards = response.json()
+        dashboards = _load_grafana_json(response)
     except requests.exceptions.HTTPError as e:
         swxsoc.log.error(f"Failed to retrieve dashboards: {e}")
         return None
     except requests.exceptions.ConnectionError as e:
         swxsoc.log.error(f"Failed to retrieve panels for dashboard: {e}")
         return None
+    except requests.exceptions.Timeout as e:
+        swxsoc.log.error(f"Timed out retrieving dashboards: {e}")
+        return None
 
     matching_dashboards = [
         dashboard
@@ -1073,7 +2042,9 @@ def get_dashboard_id(
             f"Using the first matching dashboard UID ({matching_dashboards[0]['uid']}). Consider using unique dashboard titles."
         )
 
-    return matching_dashboards[0]["uid"] if matching_dashboards else None
+    dashboard_uid = matching_dashboards[0]["uid"] if matching_dashboards else None
+    _set_grafana_lookup(cache_key, dashboard_uid)
+    return dashboard_uid
 
 
 def get_panel_id(
@@ -1089,51 +2060,63 @@ def get_panel_id(
     Returns:
         Optional[int]: The ID of the panel, or None if not found.
     """
-    try:
-        # Set the base URL and API key for Grafana Annotations API
-        # You need to set the GRAFANA_API_KEY environment variables to use this feature
-        API_KEY = os.environ.get("GRAFANA_API_KEY", None)
-        HEADERS = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-        BASE_URL = (
-            f"https://grafana.{swxsoc.config['mission']['mission_name']}.swsoc.smce.nasa.gov"
-            if not mission_dashboard
-            else f"https://grafana.{mission_dashboard}.swsoc.smce.nasa.gov"
-        )
-        response = requests.get(
-            f"{BASE_URL}/api/dashboards/uid/{dashboard_id}", headers=HEADERS
-        )
-        response.raise_for_status()
-        panels = response.json().get("dashboard", {}).get("panels", [])
+    # all panels of a dashboard are remembered so looking up its other panels needs no requests
+    cache_key = ("panels", _get_grafana_url(mission_dashboard), dashboard_id)
+    found, panel_ids = _get_grafana_lookup(cache_key)
+    if not found:
+        try:
+            HEADERS = _get_grafana_headers()
+            BASE_URL = _get_grafana_url(mission_dashboard)
+            response = _grafana_session.get(
+                f"{BASE_URL}/api/dashboards/uid/{dashboard_id}",
+                headers=HEADERS,
+                timeout=_GRAFANA_TIMEOUT,
+            )
+            response.raise_for_status()
+            panels = _load_grafana_json(response).get("dashboard", {}).get("panels", [])
 
-    except requests.exceptions.HTTPError as e:
-        swxsoc.log.error(
-            f"Failed to retrieve panels for dashboard ID {dashboard_id}: {e}"
-        )
-        return None
+        except requests.exceptions.HTTPError as e:
+            swxsoc.log.error(
+                f"Failed to retrieve panels for dashboard ID {dashboard_id}: {e}"
+            )
+            return None
 
-    except requests.exceptions.ConnectionError as e:
-        swxsoc.log.error(
-            f"Failed to retrieve panels for dashboard ID {dashboard_id}: {e}"
-        )
-        return None
+        except requests.exceptions.ConnectionError as e:
+            swxsoc.log.error(
+                f"Failed to retrieve panels for dashboard ID {dashboard_id}: {e}"
+            )
+            return None
+        except requests.exceptions.Timeout as e:
+            swxsoc.log.error(
+                f"Timed out retrieving panels for dashboard ID {dashboard_id}: {e}"
+            )
+            return None
+
+        # map each panel title to the IDs of all panels with that title, in dashboard order
+        panel_ids = {}
+        for panel in panels:
+            panel_ids.setdefault(panel.get("title"), []).append(panel.get("id"))
+        _set_grafana_lookup(cache_key, panel_ids)
 
-    matching_panels = [panel for panel in panels if panel["title"] == panel_name]
+    matching_ids = panel_ids.get(panel_name, [])
 
-    if len(matching_panels) == 0:
+    if len(matching_ids) == 0:
         swxsoc.log.warning(
-            f"Panel with title '{panel_name}' not found in dashboard ID {dashboard_id}. Annotation will be created without a panel."
+            "Panel with title '%s' not found in dashboard ID %s. Annotation will be created without a panel.",
+            panel_name,
+            dashboard_id,
         )
 
-    if len(matching_panels) > 1:
+    if len(matching_ids) > 1:
         swxsoc.log.warning(
-            f"Multiple panels with title '{panel_name}' found in dashboard ID {dashboard_id}. "
-            f"Using the first matching panel ID ({matching_panels[0]['id']}). Consider using unique panel titles."
+            "Multiple panels with title '%s' found in dashboard ID %s. "
+            "Using the first matching panel ID (%s). Consider using unique panel titles.",
+            panel_name,
+            dashboard_id,
+            matching_ids[0],
         )
 
-    return matching_panels[0]["id"] if matching_panels else None
+    return matching_ids[0] if matching_ids else None
 
 
 def query_annotations(
@@ -1146,6 +2129,8 @@ def query_annotations(
     dashboard_name: Optional[str] = None,
     panel_name: Optional[str] = None,
     mission_dashboard: Optional[str] = None,
+    match_any: bool = False,
+    annotation_type: Optional[str] = None,
 ) -> List[Dict[str, Union[str, int]]]:
     """
     Queries annotations within a specific timeframe with optional filters for tags, dashboard, and panel names.
@@ -1159,6 +2144,8 @@ def query_annotations(
         panel_id (Optional[int]): ID of the panel to filter annotations.
         dashboard_name (Optional[str]): Name of the dashboard to look up UID if `dashboard_id` is not provided.
         panel_name (Optional[str]): Name of the panel to look up ID if `panel_id` is not provided.
+        match_any (bool): Whether annotations with any of the tags match, rather than only annotations with all of them.
+        annotation_type (Optional[str]): Only return annotations of this type, "annotation" or "alert".
 
     Returns:
         List[Dict[str, Union[str, int]]]: List of annotations matching the query criteria.
@@ -1179,29 +2166,26 @@ def query_annotations(
     }
     if tags:
         params["tags"] = tags
+        if match_any:
+            params["matchAny"] = "true"
+    if annotation_type:
+        params["type"] = annotation_type
     if dashboard_id:
         params["dashboardUID"] = dashboard_id
     if panel_id:
         params["panelId"] = panel_id
 
     try:
-        # Set the base URL and API key for Grafana Annotations API
-        # You need to set the GRAFANA_API_KEY environment variables to use this feature
-        API_KEY = os.environ.get("GRAFANA_API_KEY", None)
-        HEADERS = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-        BASE_URL = (
-            f"https://grafana.{swxsoc.config['mission']['mission_name']}.swsoc.smce.nasa.gov"
-            if not mission_dashboard
-            else f"https://grafana.{mission_dashboard}.swsoc.smce.nasa.gov"
-        )
-        response = requests.get(
-            f"{BASE_URL}/api/annotations", headers=HEADERS, params=params
+        HEADERS = _get_grafana_headers()
+        BASE_URL = _get_grafana_url(mission_dashboard)
+        response = _grafana_session.get(
+            f"{BASE_URL}/api/annotations",
+            headers=HEADERS,
+            params=params,
+            timeout=_GRAFANA_TIMEOUT,
         )
         response.raise_for_status()
-        return response.json()
+        return _load_grafana_json(response)
     except requests.exceptions.HTTPError as e:
         swxsoc.log.error(f"Failed to query annotations: {e}")
         return []
@@ -1210,6 +2194,9 @@ def query_annotations(
             f"Failed to retrieve panels for dashboard ID {dashboard_id}: {e}"
         )
         return []
+    except requests.exceptions.Timeout as e:
+        swxsoc.log.error(f"Timed out querying annotations: {e}")
+        return []
 
 
 def create_annotation(
@@ -1246,9 +2233,10 @@ def create_annotation(
     if dashboard_id and panel_name and not panel_id:
         panel_id = get_panel_id(dashboard_id, panel_name, mission_dashboard)
 
+    start_ms = _to_milliseconds(start_time)
+
     # Overwrite functionality: query and remove existing identical annotations
     if overwrite:
-        swxsoc.log.info("Overwriting existing annotations.")
         existing_annotations = query_annotations(
             start_time=start_time,
             end_time=end_time or start_time,
@@ -1256,19 +2244,40 @@ def create_annotation(
             dashboard_id=dashboard_id,
             panel_id=panel_id,
             mission_dashboard=mission_dashboard,
+            # only annotations with all the tags can match, and never alerts
+            annotation_type="annotation",
         )
 
-        for annotation in existing_annotations:
-            if annotation.get("text") == text:
-                annotation_id = annotation.get("id")
-                if annotation_id:
-                    removed = remove_annotation_by_id(annotation_id, mission_dashboard)
-                    if removed:
-                        swxsoc.log.info(
-                            f"Removed existing annotation with ID {annotation_id}."
-                        )
+        # each annotation is only removed once even if Grafana returns it more than once
+        annotation_ids = list(
+            dict.fromkeys(
+                annotation.get("id")
+                for annotation in existing_annotations
+                if annotation.get("text") == text and annotation.get("id")
+            )
+        )
+        if annotation_ids:
+            swxsoc.log.info("Overwriting %d existing annotations.", len(annotation_ids))
+            # remove the annotations concurrently rather than waiting for each request in turn
+            with ThreadPoolExecutor(
+                max_workers=min(len(annotation_ids), _MAX_GRAFANA_WORKERS)
+            ) as executor:
+                removed = list(
+                    executor.map(
+                        partial(
+                            remove_annotation_by_id,
+                            mission_dashboard=mission_dashboard,
+                        ),
+                        annotation_ids,
+                    )
+                )
+            swxsoc.log.info(
+                "Removed %d of %d existing annotations.",
+                sum(removed),
+                len(annotation_ids),
+            )
     payload = {
-        "time": _to_milliseconds(start_time),
+        "time": start_ms,
         "text": text,
         "tags": tags,
     }
@@ -1280,23 +2289,16 @@ def create_annotation(
         payload["panelId"] = panel_id
 
     try:
-        # Set the base URL and API key for Grafana Annotations API
-        # You need to set the GRAFANA_API_KEY environment variables to use this feature
-        API_KEY = os.environ.get("GRAFANA_API_KEY", None)
-        HEADERS = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-        BASE_URL = (
-            f"https://grafana.{swxsoc.config['mission']['mission_name']}.swsoc.smce.nasa.gov"
-            if not mission_dashboard
-            else f"https://grafana.{mission_dashboard}.swsoc.smce.nasa.gov"
-        )
-        response = requests.post(
-            f"{BASE_URL}/api/annotations", headers=HEADERS, json=payload
+        HEADERS = _get_grafana_headers()
+        BASE_URL = _get_grafana_url(mission_dashboard)
+        response = _grafana_session.post(
+            f"{BASE_URL}/api/annotations",
+            headers=HEADERS,
+            data=_dump_grafana_json(payload),
+            timeout=_GRAFANA_TIMEOUT,
         )
         response.raise_for_status()
-        return response.json()
+        return _load_grafana_json(response)
     except requests.exceptions.HTTPError as e:
         swxsoc.log.error(f"Failed to create annotation: {e}")
         return {}
@@ -1305,6 +2307,33 @@ def create_annotation(
             f"Failed to retrieve panels for dashboard ID {dashboard_id}: {e}"
         )
         return {}
+    except requests.exceptions.Timeout as e:
+        swxsoc.log.error(f"Timed out creating annotation: {e}")
+        return {}
+
+
+def create_annotations(
+    annotations: List[Dict], max_concurrency: int = _MAX_GRAFANA_WORKERS
+) -> List[Dict[str, Union[str, int]]]:
+    """
+    Creates many annotations concurrently.
+
+    Args:
+        annotations (List[Dict]): The arguments of `create_annotation` for each annotation, e.g. ``{"start_time": ..., "text": ..., "tags": [...]}``.
+        max_concurrency (int): Maximum number of annotations created at the same time.
+
+    Returns:
+        List[Dict[str, Union[str, int]]]: The created annotation data for each annotation, in the same order. Empty if an annotation could not be created.
+    """
+    if len(annotations) == 0:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(annotations), max_concurrency)
+    ) as executor:
+        return list(
+            executor.map(lambda kwargs: create_annotation(**kwargs), annotations)
+        )
 
 
 def remove_annotation_by_id(
@@ -1320,20 +2349,12 @@ def remove_annotation_by_id(
         bool: True if the annotation was successfully deleted, False otherwise.
     """
     try:
-        # Set the base URL and API key for Grafana Annotations API
-        # You need to set the GRAFANA_API_KEY environment variables to use this feature
-        API_KEY = os.environ.get("GRAFANA_API_KEY", None)
-        HEADERS = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-        BASE_URL = (
-            f"https://grafana.{swxsoc.config['mission']['mission_name']}.swsoc.smce.nasa.gov"
-            if not mission_dashboard
-            else f"https://grafana.{mission_dashboard}.swsoc.smce.nasa.gov"
-        )
+        HEADERS = _get_grafana_headers()
+        BASE_URL = _get_grafana_url(mission_dashboard)
         full_url = f"{BASE_URL}/api/annotations/{annotation_id}"
-        response = requests.delete(full_url, headers=HEADERS)
+        response = _grafana_session.delete(
+            full_url, headers=HEADERS, timeout=_GRAFANA_TIMEOUT
+        )
         response.raise_for_status()
         return (
             response.status_code == 200
@@ -1346,3 +2367,6 @@ def remove_annotation_by_id(
     except requests.exceptions.ConnectionError as e:
         swxsoc.log.error(f"Failed to connect to the server: {e}")
         return False
+    except requests.exceptions.Timeout as e:
+        swxsoc.log.error(f"Timed out removing annotation with ID {annotation_id}: {e}")
+        return False